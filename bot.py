@@ -1,32 +1,50 @@
+import asyncio
+import bisect
+import contextlib
+import functools
 import hashlib
+import heapq
 import json
 import logging
+import math
+import mmap
+import multiprocessing
+import operator
 import os
 import random
 import re
 import shutil
+import struct
 import subprocess
+import sys
 import tempfile
 import textwrap
+import threading
 import time
 import urllib.parse
+import wave
 import xml.etree.ElementTree as ET
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from io import BytesIO
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
 
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from moviepy.editor import (
     AudioFileClip,
-    ColorClip,
     CompositeVideoClip,
     ImageClip,
     TextClip,
+    VideoClip,
     VideoFileClip,
     concatenate_videoclips,
+    vfx,
 )
 from newspaper import Article
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
@@ -51,6 +69,16 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     texttospeech = None
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import cv2
+except ImportError:  # pragma: no cover - optional dependency
+    cv2 = None
+
 try:
     from dotenv import load_dotenv
 except ImportError:  # pragma: no cover - optional dependency
@@ -94,6 +122,31 @@ class ArticleCandidate:
     source: str
     score: float = 0.0
 
+    @functools.cached_property
+    def text_lower(self) -> str:
+        """Lowercased "title summary", computed once for keyword matching."""
+        return f"{self.title} {self.summary}".lower()
+
+    @functools.cached_property
+    def primary_text_lower(self) -> str:
+        """Lowercased title plus the first 200 chars of the summary (the primary context)."""
+        return f"{self.title} {self.summary[:200]}".lower()
+
+    @functools.cached_property
+    def word_count(self) -> int:
+        """Number of words in the article body, counted once."""
+        return len(self.text.split()) if self.text else 0
+
+    @functools.cached_property
+    def title_lower(self) -> str:
+        """Lowercased title, computed once for keyword matching."""
+        return self.title.lower()
+
+    @functools.cached_property
+    def title_mentions_ai(self) -> bool:
+        """Whether the title already names AI, matched once for the script hook and metadata."""
+        return bool(_AI_TITLE_RE.search(self.title))
+
 
 @dataclass
 class WordTiming:
@@ -112,6 +165,76 @@ class Phrase:
     words: List[WordTiming]
 
 
+class BloomFilter:
+    """Compact probabilistic set used for "already covered?" URL checks.
+
+    Membership tests may return false positives (bounded by error_rate) but
+    never false negatives, so a covered story is never picked twice.
+    """
+
+    _MAGIC = b"BLM1"
+    _HEADER = struct.Struct("<4sIIQQ")  # magic, num_hashes, num_bits, capacity, count
+
+    def __init__(self, capacity: int = 10000, error_rate: float = 1e-4):
+        capacity = max(capacity, 1)
+        num_bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.capacity = capacity
+        self.num_bits = max(num_bits, 8)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def to_file(self, path: Path) -> None:
+        """Persist the filter atomically to a binary file."""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(self._HEADER.pack(self._MAGIC, self.num_hashes, self.num_bits, self.capacity, self.count))
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "BloomFilter":
+        with open(path, 'rb') as f:
+            header = f.read(cls._HEADER.size)
+            bits = f.read()
+        magic, num_hashes, num_bits, capacity, count = cls._HEADER.unpack(header)
+        if magic != cls._MAGIC or len(bits) != (num_bits + 7) // 8:
+            raise ValueError(f"Invalid bloom filter file: {path}")
+        bloom = cls.__new__(cls)
+        bloom.num_hashes = num_hashes
+        bloom.num_bits = num_bits
+        bloom.capacity = capacity
+        bloom.bits = bytearray(bits)
+        bloom.count = count
+        return bloom
+
+    @classmethod
+    def from_items(cls, items, capacity: int = 10000) -> "BloomFilter":
+        items = list(items)
+        bloom = cls(capacity=max(capacity, len(items) * 2))
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+
 @dataclass
 class Config:
     output_dir: Path
@@ -153,6 +276,13 @@ class Config:
     caption_max_chars_per_line: int = 40
     caption_fade_duration: float = 0.3
     caption_position: str = "center"  # bottom/center/top
+    enable_whisper_captions: bool = True  # False always uses estimated word timings
+    whisper_min_words: int = 40  # Shorter scripts skip whisper and use estimated timings
+    # Persistent download cache for stock media (survives across videos in a run)
+    cache_dir: Path = Path(".cache/media")
+    script_cache_dir: Path = Path(".cache/gemini")  # Gemini scripts memoized by prompt hash
+    # Video encoding settings
+    x264_preset: str = "veryfast"  # libx264 preset when no hardware encoder is available
 
 
 DEFAULT_SOURCES: List[SourceFeed] = [
@@ -684,6 +814,14 @@ AI_KEYWORDS = {
     "ai assistant": 2.5,  # Updated weight
 }
 
+# Single alternation over all AI keywords (longest first so "gpt-4" wins over "gpt")
+_AI_KEYWORD_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(k.lower()) for k in sorted(AI_KEYWORDS, key=len, reverse=True)) + r")\b"
+)
+
+# Substring match, as the title checks have always been ("OpenAI" counts as naming AI)
+_AI_TITLE_RE = re.compile(r"ai|artificial intelligence|machine learning|gpt|claude", re.IGNORECASE)
+
 
 def setup_logging() -> None:
     logging.basicConfig(
@@ -777,6 +915,11 @@ def load_config() -> Config:
         caption_max_chars_per_line=int(os.getenv("CAPTION_MAX_CHARS_PER_LINE", "40")),
         caption_fade_duration=float(os.getenv("CAPTION_FADE_DURATION", "0.3")),
         caption_position=os.getenv("CAPTION_POSITION", "center"),
+        enable_whisper_captions=os.getenv("ENABLE_WHISPER_CAPTIONS", "true").lower() == "true",
+        whisper_min_words=int(os.getenv("WHISPER_MIN_WORDS", "40")),
+        cache_dir=Path(os.getenv("MEDIA_CACHE_DIR", ".cache/media")),
+        script_cache_dir=Path(os.getenv("SCRIPT_CACHE_DIR", ".cache/gemini")),
+        x264_preset=os.getenv("X264_PRESET") or "veryfast",
     )
     logging.debug("Loaded config: %s", config)
     return config
@@ -803,7 +946,7 @@ def get_headers(custom_headers: Optional[Dict[str, str]] = None) -> Dict[str, st
         "User-Agent": random.choice(USER_AGENTS),
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8,application/rss+xml,application/atom+xml",
         "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate, br",
+        "Accept-Encoding": ACCEPT_ENCODING,
         "Connection": "keep-alive",
         "Upgrade-Insecure-Requests": "1",
         "Referer": "https://www.google.com/",  # Make requests look like they came from Google
@@ -813,6 +956,31 @@ def get_headers(custom_headers: Optional[Dict[str, str]] = None) -> Dict[str, st
     return headers
 
 
+def create_http_session() -> requests.Session:
+    """Create a pooled keep-alive session so repeated requests reuse TCP/TLS connections."""
+    session = requests.Session()
+    # Connection-level retries only; fetch_with_retry handles HTTP status retries
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=None),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENTS[0],
+        # Only codings urllib3 can decode here (br needs brotli/brotlicffi installed)
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+_HTTP_SESSION = create_http_session()
+# CPU threads this process may use for ffmpeg and whisper; story workers get an equal share
+_CPU_THREADS = os.cpu_count() or 4
+
+
 def fetch_with_retry(url: str, max_retries: int = 3, headers: Optional[Dict[str, str]] = None, timeout: int = 15) -> Optional[requests.Response]:
     """Fetch URL with retry logic and proper headers."""
     if headers is None:
@@ -820,12 +988,18 @@ def fetch_with_retry(url: str, max_retries: int = 3, headers: Optional[Dict[str,
     
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+            response = _HTTP_SESSION.get(url, headers=headers, timeout=timeout, allow_redirects=True)
             response.raise_for_status()
             return response
         except requests.RequestException as exc:
             if attempt < max_retries - 1:
                 wait_time = (2 ** attempt) + random.uniform(0, 1)
+                # Honor the server's Retry-After on throttling; this only blocks the calling worker
+                exc_response = getattr(exc, 'response', None)
+                if exc_response is not None and exc_response.status_code in (429, 503):
+                    retry_after = exc_response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        wait_time = min(float(retry_after), 60.0)
                 logging.debug("Retry %d/%d for %s after %.1fs: %s", attempt + 1, max_retries, url, wait_time, exc)
                 time.sleep(wait_time)
             else:
@@ -939,6 +1113,38 @@ def fetch_hackernews_stories(max_stories: int = 30) -> List[Dict]:
         return []
 
 
+# Conditional GET validators and last parsed links per feed URL:
+# {url: {"etag": str, "last_modified": str, "links": [str]}}
+_FEED_CACHE: Dict[str, Dict] = {}
+_FEED_CACHE_LOCK = threading.Lock()
+
+
+def load_feed_cache(config: Config) -> None:
+    """Load feed ETag/Last-Modified validators saved by previous runs."""
+    cache_file = config.output_dir / "feed_etags.json"
+    if not cache_file.exists():
+        return
+    try:
+        data = orjson.loads(cache_file.read_bytes())
+        with _FEED_CACHE_LOCK:
+            _FEED_CACHE.update(data)
+        logging.debug("Loaded conditional GET cache for %d feeds", len(data))
+    except (json.JSONDecodeError, IOError) as exc:
+        logging.warning("Failed to load feed cache: %s", exc)
+
+
+def save_feed_cache(config: Config) -> None:
+    """Persist feed ETag/Last-Modified validators for the next run."""
+    cache_file = config.output_dir / "feed_etags.json"
+    try:
+        config.output_dir.mkdir(parents=True, exist_ok=True)
+        with _FEED_CACHE_LOCK:
+            snapshot = dict(_FEED_CACHE)
+        cache_file.write_bytes(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+    except (IOError, Exception) as exc:
+        logging.warning("Failed to save feed cache: %s", exc)
+
+
 def fetch_rss_links(source: SourceFeed, max_entries: int = 5) -> List[str]:
     """Fetch links from RSS feed or other source types."""
     # Source fetching log removed for cleaner output - only log failures
@@ -977,9 +1183,21 @@ def fetch_rss_links(source: SourceFeed, max_entries: int = 5) -> List[str]:
     elif source.source_type == "rss" and source.rss_url:
         # Standard RSS feed (handles RSS 2.0, Atom, and other formats)
         headers = get_headers(source.headers) if source.headers else get_headers()
+        with _FEED_CACHE_LOCK:
+            cached = _FEED_CACHE.get(source.rss_url)
+        if cached and cached.get("links"):
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
         response = fetch_with_retry(source.rss_url, headers=headers)
         if not response:
             return []
+        
+        # Feed unchanged since last run: reuse the links parsed back then
+        if response.status_code == 304 and cached:
+            logging.debug("Feed not modified for %s, reusing %d cached links", source.name, len(cached["links"]))
+            return cached["links"][:max_entries]
 
         links: List[str] = []
         try:
@@ -1021,6 +1239,15 @@ def fetch_rss_links(source: SourceFeed, max_entries: int = 5) -> List[str]:
             
             if links:
                 logging.debug("Found %d links for %s", len(links), source.name)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    with _FEED_CACHE_LOCK:
+                        _FEED_CACHE[source.rss_url] = {
+                            "etag": etag,
+                            "last_modified": last_modified,
+                            "links": links,
+                        }
             else:
                 logging.warning("No links found in RSS feed for %s (may be empty or different format)", source.name)
             
@@ -1066,7 +1293,7 @@ def has_ai_tech_context(text: str, keyword: str, position: int) -> bool:
 
 def has_practical_ai_focus(candidate: ArticleCandidate) -> bool:
     """Check if article focuses on practical AI applications."""
-    text = f"{candidate.title} {candidate.summary}".lower()
+    text = candidate.text_lower
     practical_score = 0
     for term, weight in PRACTICAL_AI_USE_CASES.items():
         if term in text:
@@ -1076,7 +1303,7 @@ def has_practical_ai_focus(candidate: ArticleCandidate) -> bool:
 
 def is_overly_academic(candidate: ArticleCandidate) -> bool:
     """Check if article is overly academic/research-focused."""
-    text = f"{candidate.title} {candidate.summary}".lower()
+    text = candidate.text_lower
     academic_score = 0
     for term, weight in ACADEMIC_RESEARCH_INDICATORS.items():
         if term in text:
@@ -1210,14 +1437,14 @@ def calculate_promotional_density(text: str) -> float:
 
 def is_article_too_short(candidate: ArticleCandidate) -> bool:
     """Check if article is suspiciously short (likely an ad or low-value content)."""
-    word_count = len(candidate.text.split()) if candidate.text else 0
+    word_count = candidate.word_count
     # Very short articles (< 150 words) with exclusion keywords are suspicious
     return word_count < 150
 
 
 def analyze_title_vs_body(candidate: ArticleCandidate, keyword: str) -> int:
     """Analyze if keyword appears in title (more significant) vs body."""
-    title_lower = candidate.title.lower() if candidate.title else ""
+    title_lower = candidate.title_lower
     summary_lower = candidate.summary.lower() if candidate.summary else ""
     text_lower = candidate.text.lower() if candidate.text else ""
     
@@ -1247,7 +1474,7 @@ def should_exclude_article(candidate: ArticleCandidate) -> Optional[str]:
     """Check if article should be excluded using weighted scoring system.
     Returns exclusion reason if article should be excluded, None otherwise."""
     full_text = f"{candidate.title} {candidate.summary} {candidate.text}".lower()
-    text = f"{candidate.title} {candidate.summary}".lower()
+    text = candidate.text_lower
     
     # First check: Exclude overly academic papers without practical focus
     if is_overly_academic(candidate):
@@ -1350,7 +1577,7 @@ def should_exclude_article(candidate: ArticleCandidate) -> Optional[str]:
     
     # Dynamic threshold adjustment based on article quality
     # Longer, well-written articles get benefit of the doubt
-    word_count = len(candidate.text.split()) if candidate.text else 0
+    word_count = candidate.word_count
     if word_count > 500 and has_practical_focus:
         exclusion_threshold += 2  # Raise threshold for longer practical articles
     
@@ -1367,20 +1594,20 @@ def should_exclude_article(candidate: ArticleCandidate) -> Optional[str]:
 def has_ai_in_primary_context(candidate: ArticleCandidate) -> bool:
     """Check if AI keywords appear in the primary context (title or first 200 chars of summary).
     This ensures AI is the main topic, not just mentioned in passing."""
-    primary_text = f"{candidate.title} {candidate.summary[:200]}".lower()
+    primary_text = candidate.primary_text_lower
     
     # Check for high-weight AI keywords in primary context
     high_weight_found = False
     for keyword, weight in AI_KEYWORDS.items():
-        if weight >= 2.5 and keyword.lower() in primary_text:
+        if weight >= 2.5 and keyword in primary_text:
             high_weight_found = True
             break
     
     # Also check for any AI keywords (even lower weight) in title
-    title_lower = candidate.title.lower()
+    title_lower = candidate.title_lower
     title_ai_found = False
     for keyword in AI_KEYWORDS.keys():
-        if keyword.lower() in title_lower:
+        if keyword in title_lower:
             title_ai_found = True
             break
     
@@ -1399,7 +1626,7 @@ def calculate_ai_density(candidate: ArticleCandidate) -> float:
     ai_keyword_count = 0
     for keyword in AI_KEYWORDS.keys():
         # Count occurrences of keyword in text
-        ai_keyword_count += primary_text.count(keyword.lower())
+        ai_keyword_count += primary_text.count(keyword)
     
     # Calculate density as percentage
     density = (ai_keyword_count / len(words)) * 100
@@ -1411,12 +1638,12 @@ def is_major_ai_news(candidate: ArticleCandidate, config: Config) -> bool:
     if not config.ai_only_mode:
         return True
     
-    text = f"{candidate.title} {candidate.summary}".lower()
+    text = candidate.text_lower
     
     # Must have AI keywords
     has_ai_keywords = False
     for keyword in AI_KEYWORDS.keys():
-        if keyword.lower() in text:
+        if keyword in text:
             has_ai_keywords = True
             break
     
@@ -1426,12 +1653,12 @@ def is_major_ai_news(candidate: ArticleCandidate, config: Config) -> bool:
     # Must have major news indicators
     has_major_news = False
     for indicator in MAJOR_NEWS_INDICATORS.keys():
-        if indicator.lower() in text:
+        if indicator in text:
             has_major_news = True
             break
     
     # Check content depth
-    word_count = len(candidate.text.split())
+    word_count = candidate.word_count
     has_depth = word_count >= 300  # Substantial content
     
     # Check recency (prefer recent news)
@@ -1467,7 +1694,7 @@ def is_ai_related(candidate: ArticleCandidate, config: Config) -> bool:
     high_weight_matches = 0
     
     for keyword, weight in AI_KEYWORDS.items():
-        if keyword.lower() in text:
+        if keyword in text:
             ai_keyword_count += 1
             # High-weight keywords indicate stronger AI focus
             if weight >= 2.5:
@@ -1485,17 +1712,24 @@ def is_ai_related(candidate: ArticleCandidate, config: Config) -> bool:
 def load_article(url: str, source_name: str, config: Optional[Config] = None) -> Optional[ArticleCandidate]:
     article = Article(url=url, language="en")
     try:
-        article.download()
+        # Download through the pooled session; newspaper falls back to its own fetch
+        html = None
+        try:
+            response = _HTTP_SESSION.get(url, headers=get_headers(), timeout=15, allow_redirects=True)
+            if response.ok:
+                html = response.text
+        except requests.RequestException as exc:
+            logging.debug("Session fetch failed for %s: %s", url[:60], exc)
+        if html:
+            article.download(input_html=html)
+        else:
+            article.download()
         article.parse()
         article.nlp()
     except Exception as exc:  # pragma: no cover - third-party behavior
         logging.warning("Unable to parse article %s: %s", url, exc)
         return None
 
-    if len(article.text.split()) < 120:
-        logging.info("Skipping short article (%s)", url)
-        return None
-
     published = None
     if article.publish_date:
         published = article.publish_date
@@ -1514,6 +1748,10 @@ def load_article(url: str, source_name: str, config: Optional[Config] = None) ->
         source=source_name,
     )
     
+    if candidate.word_count < 120:
+        logging.info("Skipping short article (%s)", url)
+        return None
+    
     # Check exclusion keywords early - reject immediately if found
     if config:
         exclusion_reason = should_exclude_article(candidate)
@@ -1531,29 +1769,35 @@ def load_article(url: str, source_name: str, config: Optional[Config] = None) ->
     return candidate
 
 
-def score_article(candidate: ArticleCandidate, source_weight: float, config: Config) -> float:
-    # Check exclusion keywords first - reject immediately if found
-    exclusion_reason = should_exclude_article(candidate)
-    if exclusion_reason:
-        logging.debug("Excluding article '%s': %s", candidate.title[:50], exclusion_reason)
-        return 0.0
+# Upper bound on what finalize_scores adds on top of the content score and source weight
+_MAX_FINALIZE_BONUS = 2.5 + 0.5  # Recency, content depth
+
+
+def score_article_content(candidate: ArticleCandidate, config: Config, source_weight: float = 0.0) -> Optional[float]:
+    """Score an article's keyword/topic content.
     
+    The keyword and major-news dictionary scans run first; the exclusion analysis
+    (many passes over the full text) only runs for articles whose score, plus the
+    most finalize_scores could still add, can reach config.min_ai_score.
+    
+    Returns:
+        Content score, or None if the article is rejected outright
+    """
     # CRITICAL: Require AI in primary context for AI-only mode
     if config.ai_only_mode and not has_ai_in_primary_context(candidate):
         logging.debug("Rejecting article '%s': AI not in primary context", candidate.title[:50])
-        return 0.0
+        return None
     
     score = 0.0
-    text = f"{candidate.title} {candidate.summary}".lower()
-    primary_text = f"{candidate.title} {candidate.summary[:200]}".lower()
+    text = candidate.text_lower
+    primary_text = candidate.primary_text_lower
     
     # Count AI keyword matches (prioritize primary context)
     ai_keyword_matches = 0
     ai_keyword_score = 0.0
     primary_ai_matches = 0  # AI keywords in primary context
     
-    for keyword, weight in AI_KEYWORDS.items():
-        keyword_lower = keyword.lower()
+    for keyword_lower, weight in AI_KEYWORDS.items():  # Keys are already lowercase
         if keyword_lower in text:
             ai_keyword_matches += 1
             # Apply boost multiplier for AI keywords
@@ -1566,7 +1810,7 @@ def score_article(candidate: ArticleCandidate, source_weight: float, config: Con
     
     # Reject articles with no AI keywords (if AI-only mode is enabled)
     if config.ai_only_mode and ai_keyword_matches == 0:
-        return 0.0
+        return None
     
     score += ai_keyword_score
     
@@ -1575,7 +1819,7 @@ def score_article(candidate: ArticleCandidate, source_weight: float, config: Con
     major_indicators_found = []
     if primary_ai_matches > 0:  # Only apply if AI is in primary context
         for indicator, weight in MAJOR_NEWS_INDICATORS.items():
-            if indicator.lower() in text:
+            if indicator in text:
                 major_news_score += weight
                 major_indicators_found.append(indicator)
     
@@ -1601,41 +1845,133 @@ def score_article(candidate: ArticleCandidate, source_weight: float, config: Con
     elif ai_keyword_matches >= 2:
         score += 1.0
     
-    # Recency bonus (stronger for AI news)
-    if candidate.published:
-        age_hours = (datetime.now(timezone.utc) - candidate.published).total_seconds() / 3600
-        freshness_bonus = max(0, 48 - age_hours) / 48  # 0..1
-        score += freshness_bonus * 2.5  # Increased from 2.0 for AI news
+    # Early exit if even the largest recency/depth bonuses can't lift it to the minimum score
+    if config.ai_only_mode:
+        best_case = score + source_weight + _MAX_FINALIZE_BONUS
+        if best_case < config.min_ai_score:
+            logging.debug("Rejecting article '%s': best possible score %.2f below minimum %.2f",
+                         candidate.title[:50], best_case, config.min_ai_score)
+            return None
+    
+    # Check exclusion keywords - reject if found
+    exclusion_reason = should_exclude_article(candidate)
+    if exclusion_reason:
+        logging.debug("Excluding article '%s': %s", candidate.title[:50], exclusion_reason)
+        return None
     
-    score += source_weight
+    return score
+
 
+def finalize_scores(candidates: List[ArticleCandidate], content_scores: List[Optional[float]], source_weights: List[float], config: Config) -> np.ndarray:
+    """Add recency, source weight and depth bonuses and apply the score threshold.
+    
+    Works on parallel arrays so the numeric part of ranking is one vectorized
+    pass over all candidates instead of per-object arithmetic.
+    
+    Returns:
+        Array of final scores (0.0 for rejected articles)
+    """
+    now = datetime.now(timezone.utc)
+    rejected = np.array([s is None for s in content_scores], dtype=bool)
+    scores = np.array([s or 0.0 for s in content_scores], dtype=np.float64)
+    age_hours = np.array([
+        (now - c.published).total_seconds() / 3600 if c.published else np.inf
+        for c in candidates
+    ], dtype=np.float64)
+    word_counts = np.array([c.word_count for c in candidates], dtype=np.int32)
+    
+    # Recency bonus (stronger for AI news)
+    # Clipped so future-dated articles (clock skew, bad feed timestamps) stay within the
+    # recency share of _MAX_FINALIZE_BONUS that the early reject relies on
+    freshness_bonus = np.clip((48 - age_hours) / 48, 0.0, 1.0)
+    scores += freshness_bonus * 2.5  # Increased from 2.0 for AI news
+    
+    scores += np.asarray(source_weights, dtype=np.float64)
+    
     # Content depth bonus
-    if len(candidate.text.split()) > 600:
-        score += 0.5
+    scores += np.where(word_counts > 600, 0.5, 0.0)
     
     # Apply minimum score threshold
-    if config.ai_only_mode and score < config.min_ai_score:
-        logging.debug("Rejecting article '%s': score %.2f below minimum %.2f", 
-                     candidate.title[:50], score, config.min_ai_score)
-        return 0.0
+    if config.ai_only_mode:
+        below_minimum = ~rejected & (scores < config.min_ai_score)
+        for i in np.flatnonzero(below_minimum):
+            logging.debug("Rejecting article '%s': score %.2f below minimum %.2f", 
+                         candidates[i].title[:50], scores[i], config.min_ai_score)
+        rejected |= below_minimum
+    
+    return np.where(rejected, 0.0, np.round(scores, 2))
 
-    return round(score, 2)
+
+def score_article(candidate: ArticleCandidate, source_weight: float, config: Config) -> float:
+    content_score = score_article_content(candidate, config, source_weight)
+    if content_score is None:
+        return 0.0
+    return float(finalize_scores([candidate], [content_score], [source_weight], config)[0])
 
 
-def rank_articles(candidates: List[ArticleCandidate], sources: List[SourceFeed], config: Config) -> List[ArticleCandidate]:
+def rank_articles(candidates: List[ArticleCandidate], sources: List[SourceFeed], config: Config, max_stories: Optional[int] = None) -> List[ArticleCandidate]:
+    """Score candidates and return them best first.
+    
+    When max_stories is given only that many top candidates are returned,
+    selected with a bounded heap instead of a full sort.
+    """
     weights = {source.name: source.weight for source in sources}
-    for candidate in candidates:
-        candidate.score = score_article(candidate, weights.get(candidate.source, 1.0), config)
+    source_weights = [weights.get(candidate.source, 1.0) for candidate in candidates]
+    content_scores = [
+        score_article_content(candidate, config, source_weight)
+        for candidate, source_weight in zip(candidates, source_weights)
+    ]
+    scores = finalize_scores(candidates, content_scores, source_weights, config)
+    for candidate, score in zip(candidates, scores.tolist()):
+        candidate.score = score
     
     # Filter out zero-scored articles (non-AI articles in AI-only mode)
     if config.ai_only_mode:
         candidates = [c for c in candidates if c.score > 0]
     
-    return sorted(candidates, key=lambda c: c.score, reverse=True)
+    if max_stories is not None:
+        return heapq.nlargest(max_stories, candidates, key=operator.attrgetter('score'))
+    return sorted(candidates, key=operator.attrgetter('score'), reverse=True)
+
+
+_HOST_LAST_REQUEST: Dict[str, float] = {}
+_HOST_LAST_REQUEST_LOCK = threading.Lock()
+
+SOURCE_FETCH_WORKERS = 8
+
+
+def _source_host(source: SourceFeed) -> str:
+    """Return the host a source fetch will hit, used as the rate-limit key."""
+    if source.source_type == "reddit":
+        return "www.reddit.com"
+    if source.source_type == "hackernews":
+        return "hacker-news.firebaseio.com"
+    if source.source_type == "googlenews":
+        return "news.google.com"
+    url = source.rss_url or source.html_url or ""
+    return urllib.parse.urlparse(url).netloc or source.name
+
+
+def _throttle_host(host: str) -> None:
+    """Sleep so consecutive requests to the same host are spaced 0.5-2s apart."""
+    with _HOST_LAST_REQUEST_LOCK:
+        now = time.monotonic()
+        last = _HOST_LAST_REQUEST.get(host)
+        # Reserve the next slot before sleeping so concurrent callers queue up
+        wait = 0.0 if last is None else max(0.0, last + random.uniform(0.5, 2.0) - now)
+        _HOST_LAST_REQUEST[host] = now + wait
+    if wait > 0:
+        time.sleep(wait)
 
 
-def collect_candidates(sources: List[SourceFeed], max_articles: int, config: Config) -> List[ArticleCandidate]:
+def _fetch_source_links(source: SourceFeed, max_entries: int) -> List[str]:
+    _throttle_host(_source_host(source))
+    return fetch_rss_links(source, max_entries=max_entries)
+
+
+def collect_candidates(sources: List[SourceFeed], max_articles: int, config: Config, covered: Optional[BloomFilter] = None) -> List[ArticleCandidate]:
     seen_links = set()
+    covered_skipped = 0
     candidates: List[ArticleCandidate] = []
     total_articles_checked = 0
     ai_articles_found = 0
@@ -1647,50 +1983,68 @@ def collect_candidates(sources: List[SourceFeed], max_articles: int, config: Con
     # Sort sources by weight (highest first) to prioritize AI-focused sources
     sorted_sources = sorted(sources, key=lambda s: s.weight, reverse=True)
     
-    for source in sorted_sources:
-        if len(candidates) >= max_articles:
-            break
+    load_feed_cache(config)
+    
+    # Fetch all feeds concurrently (rate limited per host), then consume in weight order
+    with ThreadPoolExecutor(max_workers=SOURCE_FETCH_WORKERS) as executor:
+        futures = [
+            (source, executor.submit(_fetch_source_links, source, 10))  # Get more links per source
+            for source in sorted_sources
+        ]
         
-        try:
-            # Add small random delay between source requests to avoid rate limiting
-            if sources_succeeded > 0 or sources_failed > 0:  # Don't delay the first source
-                time.sleep(random.uniform(0.5, 2.0))
-            
-            links = fetch_rss_links(source, max_entries=10)  # Get more links per source
-            
-            if not links:
-                sources_failed += 1
-                logging.debug("No links found from %s", source.name)
-                continue
-            
-            sources_succeeded += 1
-            logging.debug("Successfully fetched %d links from %s", len(links), source.name)
+        for source, future in futures:
+            if len(candidates) >= max_articles:
+                break
             
-            for link in links:
-                if len(candidates) >= max_articles:
-                    break
-                if link in seen_links:
+            try:
+                links = future.result()
+                
+                if not links:
+                    sources_failed += 1
+                    logging.debug("No links found from %s", source.name)
                     continue
-                seen_links.add(link)
-                total_articles_checked += 1
                 
-                try:
-                    article = load_article(link, source.name, config)
-                    if article:
-                        # Check if it's major AI news
-                        if is_major_ai_news(article, config):
-                            major_news_count += 1
-                        candidates.append(article)
-                        ai_articles_found += 1
-                    else:
+                sources_succeeded += 1
+                logging.debug("Successfully fetched %d links from %s", len(links), source.name)
+                
+                for link in links:
+                    if len(candidates) >= max_articles:
+                        break
+                    if link in seen_links:
+                        continue
+                    seen_links.add(link)
+                    # Already covered in a previous run: skip before any article download
+                    if covered is not None and link in covered:
+                        covered_skipped += 1
+                        continue
+                    total_articles_checked += 1
+                    
+                    try:
+                        article = load_article(link, source.name, config)
+                        if article:
+                            # Check if it's major AI news
+                            if is_major_ai_news(article, config):
+                                major_news_count += 1
+                            candidates.append(article)
+                            ai_articles_found += 1
+                        else:
+                            excluded_count += 1
+                    except Exception as exc:
+                        logging.debug("Failed to load article %s: %s", link[:50], exc)
                         excluded_count += 1
-                except Exception as exc:
-                    logging.debug("Failed to load article %s: %s", link[:50], exc)
-                    excluded_count += 1
-        except Exception as exc:
-            sources_failed += 1
-            logging.warning("Error fetching from %s: %s", source.name, exc)
-            continue
+            except Exception as exc:
+                sources_failed += 1
+                logging.warning("Error fetching from %s: %s", source.name, exc)
+                continue
+        
+        # Enough candidates collected: don't wait on feeds that haven't started yet
+        for _, future in futures:
+            future.cancel()
+    
+    save_feed_cache(config)
+    
+    if covered_skipped:
+        logging.debug("Skipped %d already covered links without downloading", covered_skipped)
     
     # Consolidated collection stats
     if config.ai_only_mode:
@@ -1707,30 +2061,106 @@ def collect_candidates(sources: List[SourceFeed], max_articles: int, config: Con
     return candidates
 
 
-def load_covered_stories(config: Config) -> Set[str]:
-    """Load set of already covered story URLs from JSON file.
+def _rebuild_covered_bloom(urls, bloom_file: Path) -> BloomFilter:
+    """Build a fresh Bloom filter from covered URLs and persist it."""
+    bloom = BloomFilter.from_items(urls)
+    try:
+        bloom.to_file(bloom_file)
+    except OSError as exc:
+        logging.warning("Failed to save covered stories bloom filter: %s", exc)
+    return bloom
+
+
+def iter_json_object_items(path: Path):
+    """Yield (key, value) pairs of a top-level JSON object.
+
+    Streams with ijson when installed so only one entry is materialized at a
+    time; otherwise falls back to a full orjson parse.
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.kvitems(f, '', use_float=True)
+    else:
+        yield from orjson.loads(path.read_bytes()).items()
+
+
+COVERED_STORY_MAX_AGE = timedelta(days=30)
+
+
+def _covered_log_path(config: Config) -> Path:
+    """Return the append-only covered stories log, migrating the legacy JSON file once."""
+    log_file = config.output_dir / "covered_stories.jsonl"
+    legacy_file = config.output_dir / "covered_stories.json"
+    if not log_file.exists() and legacy_file.exists():
+        try:
+            # Legacy format: {url: {title, date_covered, ...}}
+            records = {url: {'url': url, **info} for url, info in iter_json_object_items(legacy_file)}
+            _write_covered_log(log_file, records)
+            legacy_file.unlink()
+            logging.debug("Migrated %d covered stories to %s", len(records), log_file.name)
+        except (json.JSONDecodeError, IOError, ValueError) as exc:
+            logging.warning("Failed to migrate covered stories file: %s", exc)
+    return log_file
+
+
+def _write_covered_log(log_file: Path, records: Dict[str, Dict]) -> None:
+    """Atomically rewrite the log with one line per covered URL."""
+    tmp_file = log_file.with_suffix(log_file.suffix + ".tmp")
+    tmp_file.write_bytes(b"".join(orjson.dumps(record) + b"\n" for record in records.values()))
+    os.replace(tmp_file, log_file)
+
+
+def _read_covered_log(log_file: Path) -> Tuple[Dict[str, Dict], int]:
+    """Stream the log; the last line for a URL wins.
     
     Returns:
-        Set of story URLs that have already been covered
+        Tuple of ({url: record}, number of lines read)
     """
-    covered_file = config.output_dir / "covered_stories.json"
-    
+    records: Dict[str, Dict] = {}
+    line_count = 0
+    with open(log_file, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            line_count += 1
+            try:
+                record = orjson.loads(line)
+                records[record['url']] = record
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+    return records, line_count
+
+
+def load_covered_stories(config: Config) -> BloomFilter:
+    """Load already covered story URLs as a persistent Bloom filter.
+
+    The filter lives in covered.bloom next to covered_stories.jsonl; the
+    log keeps the per-story metadata and drives the 30-day cleanup.
+
+    Returns:
+        Bloom filter supporting `url in covered` membership tests
+    """
+    covered_file = _covered_log_path(config)
+    bloom_file = config.output_dir / "covered.bloom"
+
     if not covered_file.exists():
         logging.debug("No covered stories file found, starting fresh")
-        return set()
-    
+        return BloomFilter()
+
     try:
-        with open(covered_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Extract URLs from the data structure
-        # Data format: {url: {title, date_covered, ...}}
-        covered_urls = set(data.keys())
-        
+        bloom = None
+        if bloom_file.exists():
+            try:
+                bloom = BloomFilter.from_file(bloom_file)
+            except (OSError, ValueError, struct.error) as exc:
+                logging.warning("Failed to load covered stories bloom filter, rebuilding: %s", exc)
+
+        records, line_count = _read_covered_log(covered_file)
+
         # Clean up old entries (older than 30 days)
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=30)
+        cutoff_date = datetime.now(timezone.utc) - COVERED_STORY_MAX_AGE
         cleaned_data = {}
-        for url, info in data.items():
+        for url, info in records.items():
             try:
                 date_covered = datetime.fromisoformat(info.get('date_covered', ''))
                 if date_covered >= cutoff_date:
@@ -1739,18 +2169,82 @@ def load_covered_stories(config: Config) -> Set[str]:
                 # Keep entries with invalid dates (better safe than sorry)
                 cleaned_data[url] = info
         
-        # Save cleaned data if we removed entries
-        if len(cleaned_data) < len(data):
-            with open(covered_file, 'w', encoding='utf-8') as f:
-                json.dump(cleaned_data, f, indent=2, ensure_ascii=False)
-            logging.debug("Cleaned up %d old covered stories", len(data) - len(cleaned_data))
+        # Compact the log if we removed entries or superseded lines piled up
+        if len(cleaned_data) < len(records) or line_count > 2 * len(cleaned_data):
+            _write_covered_log(covered_file, cleaned_data)
+            logging.debug("Compacted covered stories log from %d to %d lines", line_count, len(cleaned_data))
         
+        if len(cleaned_data) < len(records):
+            logging.debug("Cleaned up %d old covered stories", len(records) - len(cleaned_data))
+            # Bloom filters cannot forget entries, so rebuild from what is left
+            bloom = None
+
+        if bloom is None:
+            bloom = _rebuild_covered_bloom(cleaned_data.keys(), bloom_file)
+
         logging.debug("Loaded %d covered stories from history", len(cleaned_data))
-        return set(cleaned_data.keys())
-        
+        return bloom
+
     except (json.JSONDecodeError, IOError, Exception) as exc:
         logging.warning("Failed to load covered stories file: %s", exc)
-        return set()
+        return BloomFilter()
+
+
+USED_MEDIA_MAX_AGE = timedelta(days=3)
+USED_MEDIA_COMPACT_LINES = 2000
+
+
+def _used_media_log_path(config: Config) -> Path:
+    """Return the append-only used media log, migrating the legacy JSON file once."""
+    log_file = config.output_dir / "used_media_ids.jsonl"
+    legacy_file = config.output_dir / "used_media_ids.json"
+    if not log_file.exists() and legacy_file.exists():
+        try:
+            # Legacy format: {media_id: date_used}
+            data = orjson.loads(legacy_file.read_bytes())
+            _write_used_media_log(log_file, data)
+            legacy_file.unlink()
+            logging.debug("Migrated %d used media IDs to %s", len(data), log_file.name)
+        except (json.JSONDecodeError, IOError) as exc:
+            logging.warning("Failed to migrate used media file: %s", exc)
+    return log_file
+
+
+def _write_used_media_log(log_file: Path, latest: Dict[str, str]) -> None:
+    """Atomically rewrite the log with one line per media ID."""
+    tmp_file = log_file.with_suffix(log_file.suffix + ".tmp")
+    tmp_file.write_bytes(b"".join(
+        orjson.dumps({"id": media_id, "ts": ts}) + b"\n" for media_id, ts in latest.items()
+    ))
+    os.replace(tmp_file, log_file)
+
+
+def _read_used_media_log(log_file: Path) -> Tuple[Dict[str, str], int]:
+    """Stream the log, keeping the latest timestamp per ID within the reuse window.
+
+    Returns:
+        Tuple of ({media_id: date_used}, number of lines read)
+    """
+    cutoff_date = datetime.now(timezone.utc) - USED_MEDIA_MAX_AGE
+    latest: Dict[str, str] = {}
+    line_count = 0
+    with open(log_file, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            line_count += 1
+            try:
+                record = orjson.loads(line)
+                media_id, ts = record["id"], record["ts"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+            try:
+                if datetime.fromisoformat(ts) < cutoff_date:
+                    continue
+            except (ValueError, TypeError):
+                pass  # Keep entries with invalid dates
+            latest[media_id] = ts
+    return latest, line_count
 
 
 def load_used_media_ids(config: Config) -> Set[str]:
@@ -1759,85 +2253,75 @@ def load_used_media_ids(config: Config) -> Set[str]:
     Returns:
         Set of media IDs (from Pexels, Pixabay, Unsplash) that have been used
     """
-    used_media_file = config.output_dir / "used_media_ids.json"
+    used_media_file = _used_media_log_path(config)
     
     if not used_media_file.exists():
         logging.debug("No used media file found, starting fresh")
         return set()
     
     try:
-        with open(used_media_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Data format: {media_id: date_used}
-        used_ids = set(data.keys())
-        
-        # Clean up old entries (older than 3 days to allow some reuse after a while)
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=3)
-        cleaned_data = {}
-        for media_id, date_str in data.items():
-            try:
-                date_used = datetime.fromisoformat(date_str)
-                if date_used >= cutoff_date:
-                    cleaned_data[media_id] = date_str
-            except (ValueError, TypeError):
-                # Keep entries with invalid dates
-                cleaned_data[media_id] = date_str
+        # Entries older than 3 days are dropped to allow some reuse after a while
+        latest, line_count = _read_used_media_log(used_media_file)
         
-        # Save cleaned data if we removed entries
-        if len(cleaned_data) < len(data):
-            with open(used_media_file, 'w', encoding='utf-8') as f:
-                json.dump(cleaned_data, f, indent=2, ensure_ascii=False)
-            logging.debug("Cleaned up %d old used media IDs", len(data) - len(cleaned_data))
+        # Compact the log if expired or superseded lines have piled up
+        if line_count - len(latest) > USED_MEDIA_COMPACT_LINES:
+            _write_used_media_log(used_media_file, latest)
+            logging.debug("Compacted used media log from %d to %d lines", line_count, len(latest))
         
-        logging.debug("Loaded %d used media IDs from history", len(cleaned_data))
-        return set(cleaned_data.keys())
+        logging.debug("Loaded %d used media IDs from history", len(latest))
+        return set(latest)
         
-    except (json.JSONDecodeError, IOError, Exception) as exc:
+    except (IOError, Exception) as exc:
         logging.warning("Failed to load used media file: %s", exc)
         return set()
 
 
 def save_used_media_ids(media_ids: List[str], config: Config) -> None:
-    """Save media IDs that were used to avoid reuse.
+    """Append media IDs that were used to the log to avoid reuse.
     
     Args:
         media_ids: List of media IDs to mark as used
         config: Config object with output directory
     """
+    media_ids = [media_id for media_id in media_ids if media_id]  # Only save non-empty IDs
     if not media_ids:
         return
     
-    used_media_file = config.output_dir / "used_media_ids.json"
-    
-    # Load existing data
-    data = {}
-    if used_media_file.exists():
-        try:
-            with open(used_media_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError) as exc:
-            logging.warning("Failed to load used media for update: %s", exc)
-            data = {}
-    
-    # Add new entries
-    current_date = datetime.now(timezone.utc).isoformat()
-    for media_id in media_ids:
-        if media_id:  # Only save non-empty IDs
-            data[media_id] = current_date
-    
-    # Save updated data
     try:
         config.output_dir.mkdir(parents=True, exist_ok=True)
-        with open(used_media_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        used_media_file = _used_media_log_path(config)
+        current_date = datetime.now(timezone.utc).isoformat()
+        with open(used_media_file, 'ab') as f:
+            f.write(b"".join(
+                orjson.dumps({"id": media_id, "ts": current_date}) + b"\n" for media_id in media_ids
+            ))
         # Media IDs saved silently (debug only if needed)
     except (IOError, Exception) as exc:
         logging.warning("Failed to save used media IDs: %s", exc)
 
 
+# Media IDs picked by stories of the current run. The used media log only sees IDs once a
+# story has downloaded them, so concurrent stories claim their picks here first.
+_MEDIA_CLAIMS: Dict[str, bool] = {}
+_MEDIA_CLAIMS_LOCK = threading.Lock()
+
+
+def claimed_media_ids() -> Set[str]:
+    """Media IDs already claimed by stories of this run."""
+    return set(_MEDIA_CLAIMS.keys())
+
+
+def claim_media(results: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Claim the media IDs of (url, media_id) results, dropping any another story claimed first."""
+    with _MEDIA_CLAIMS_LOCK:
+        taken = set(_MEDIA_CLAIMS.keys())
+        kept = [(url, media_id) for url, media_id in results if not media_id or media_id not in taken]
+        _MEDIA_CLAIMS.update({media_id: True for _, media_id in kept if media_id})
+    return kept
+
+
 def save_covered_story(story: ArticleCandidate, config: Config, youtube_id: Optional[str] = None, tiktok_id: Optional[str] = None) -> None:
-    """Save a story as covered in the JSON file.
+    """Append a story to the covered stories log.
     
     Args:
         story: The article candidate that was covered
@@ -1845,20 +2329,8 @@ def save_covered_story(story: ArticleCandidate, config: Config, youtube_id: Opti
         youtube_id: Optional YouTube video ID if uploaded
         tiktok_id: Optional TikTok video ID if uploaded
     """
-    covered_file = config.output_dir / "covered_stories.json"
-    
-    # Load existing data
-    data = {}
-    if covered_file.exists():
-        try:
-            with open(covered_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError) as exc:
-            logging.warning("Failed to load covered stories for update: %s", exc)
-            data = {}
-    
-    # Add or update entry
-    data[story.url] = {
+    record = {
+        'url': story.url,
         'title': story.title,
         'date_covered': datetime.now(timezone.utc).isoformat(),
         'source': story.source,
@@ -1866,14 +2338,29 @@ def save_covered_story(story: ArticleCandidate, config: Config, youtube_id: Opti
         'tiktok_id': tiktok_id,
     }
     
-    # Save updated data
     try:
         # Ensure output directory exists
         config.output_dir.mkdir(parents=True, exist_ok=True)
         
-        with open(covered_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
+        covered_file = _covered_log_path(config)
+        with open(covered_file, 'ab') as f:
+            f.write(orjson.dumps(record) + b"\n")
+
+        bloom_file = config.output_dir / "covered.bloom"
+        bloom = None
+        if bloom_file.exists():
+            try:
+                bloom = BloomFilter.from_file(bloom_file)
+            except (OSError, ValueError, struct.error):
+                bloom = None
+        if bloom is None or bloom.count >= bloom.capacity:
+            # Missing, corrupt or saturated filter: rebuild sized for the history
+            records, _ = _read_covered_log(covered_file)
+            _rebuild_covered_bloom(records.keys(), bloom_file)
+        else:
+            bloom.add(story.url)
+            bloom.to_file(bloom_file)
+
         logging.debug("Saved story as covered: %s", story.url[:60])
     except (IOError, Exception) as exc:
         logging.warning("Failed to save covered story: %s", exc)
@@ -1890,7 +2377,7 @@ def select_top_stories(sources: List[SourceFeed], max_articles: int, max_stories
     # Load already covered stories
     covered_urls = load_covered_stories(config)
     
-    candidates = collect_candidates(sources, max_articles, config)
+    candidates = collect_candidates(sources, max_articles, config, covered=covered_urls)
     if not candidates:
         if config.ai_only_mode:
             logging.error("No AI-related articles available for selection")
@@ -1910,7 +2397,7 @@ def select_top_stories(sources: List[SourceFeed], max_articles: int, max_stories
         logging.warning("All candidates were already covered. No new stories available.")
         return []
     
-    ranked = rank_articles(candidates, sources, config)
+    ranked = rank_articles(candidates, sources, config, max_stories)
     if not ranked:
         if config.ai_only_mode:
             logging.error("No AI-related articles available for selection")
@@ -1930,21 +2417,61 @@ def select_top_stories(sources: List[SourceFeed], max_articles: int, max_stories
             selected_stories.append(story)
             seen_urls.add(story.url)
             density = calculate_ai_density(story) if config.ai_only_mode else 0.0
-            ai_keywords_found = [k for k in AI_KEYWORDS.keys() if k.lower() in story.title.lower() or k.lower() in story.summary.lower()][:3] if config.ai_only_mode else []
+            ai_keywords_found = list(dict.fromkeys(_AI_KEYWORD_RE.findall(story.text_lower)))[:3] if config.ai_only_mode else []
+            if ai_keywords_found:
+                logging.debug("AI keywords: %s (density: %.2f%%)", ", ".join(ai_keywords_found), density)
             logging.info("Selected: '%s' (score: %.2f)", story.title[:60], story.score)
     
     return selected_stories
 
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Patterns used by clean_script_for_tts, compiled once at import time
+# All markdown constructs in one alternation; the named group that matched holds
+# the text to keep (code fences and headers keep nothing)
+_MARKDOWN_RE = re.compile(
+    r"```[\w]*\n?"                        # Code block fences
+    r"|\*\*(?P<bold>[^*]+)\*\*"            # Bold
+    r"|\*(?P<italic>[^*]+)\*"               # Italic
+    r"|__(?P<bold_u>[^_]+)__"               # Bold (underscore)
+    r"|_(?P<italic_u>[^_]+)_"               # Italic (underscore)
+    r"|#+\s*"                               # Headers
+    r"|\[(?P<link>[^\]]+)\]\([^\)]+\)"      # Links [text](url) -> text
+    r"|`(?P<code>[^`]+)`"                   # Inline code
+)
+_RESPONSE_PREFIX_RE = re.compile(
+    r"^(?:(?:here's the script|here is the script|the script|script for the video"
+    r"|video script|script|narration|voiceover):?\s*)+",
+    re.IGNORECASE,
+)
+_BULLET_MARKER_RE = re.compile(r"^[-*+]\s+")
+_NUMBERED_MARKER_RE = re.compile(r"^\d+\.\s+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([.!?])+")
+_AI_POSSESSIVE_RE = re.compile(r"\bAI's\b", re.IGNORECASE)
+_AI_WORD_RE = re.compile(r"\bAI\b", re.IGNORECASE)
+_METADATA_LINE_MARKERS = ("requirements:", "note:", "instructions:", "duration:", "target:")
+
+
 def extract_key_points(text: str, max_points: int) -> List[str]:
     sentences = [
         sentence.strip()
-        for sentence in re.split(r"(?<=[.!?])\s+", text)
+        for sentence in _SENTENCE_SPLIT_RE.split(text)
         if sentence.strip()
     ]
     return sentences[:max_points]
 
 
+def count_script_words(script: str) -> int:
+    """Count words in a cleaned script.
+    
+    Cleaned scripts have single-space separated words, so counting spaces is
+    enough and avoids building a token list.
+    """
+    return script.count(" ") + 1 if script else 0
+
+
 def truncate_script_to_word_limit(script: str, max_words: int) -> str:
     """Truncate script to maximum word count, ensuring it ends at a sentence boundary."""
     if not script:
@@ -1959,14 +2486,16 @@ def truncate_script_to_word_limit(script: str, max_words: int) -> str:
     truncated_text = " ".join(truncated_words)
     
     # Try to end at a sentence boundary
-    # Look for the last sentence-ending punctuation
-    last_period = truncated_text.rfind(".")
-    last_exclamation = truncated_text.rfind("!")
-    last_question = truncated_text.rfind("?")
-    
-    last_sentence_end = max(last_period, last_exclamation, last_question)
+    # Scan backwards once for the last sentence-ending punctuation, but only
+    # through the last 30% of the text since an earlier boundary is not used
+    min_sentence_end = len(truncated_text) * 0.7
+    last_sentence_end = -1
+    for i in range(len(truncated_text) - 1, int(min_sentence_end), -1):
+        if truncated_text[i] in ".!?":
+            last_sentence_end = i
+            break
     
-    if last_sentence_end > len(truncated_text) * 0.7:  # If sentence end is in last 30% of text
+    if last_sentence_end > min_sentence_end:  # If sentence end is in last 30% of text
         truncated_text = truncated_text[:last_sentence_end + 1]
     else:
         # No good sentence boundary, just add ellipsis
@@ -1975,37 +2504,22 @@ def truncate_script_to_word_limit(script: str, max_words: int) -> str:
     return truncated_text
 
 
+def _strip_markdown_match(match: re.Match) -> str:
+    content = match.group(match.lastgroup) if match.lastgroup else ""
+    # Formatting can be nested (e.g. **_word_**), so clean the kept text too
+    return _MARKDOWN_RE.sub(_strip_markdown_match, content) if content else ""
+
+
 def clean_script_for_tts(script: str) -> str:
     """Clean and parse script text for TTS, removing markdown, response prefixes, and formatting."""
     if not script:
         return ""
     
-    # Remove markdown code blocks
-    script = re.sub(r"```[\w]*\n?", "", script)
-    script = re.sub(r"```", "", script)
-    
-    # Remove markdown formatting
-    script = re.sub(r"\*\*([^*]+)\*\*", r"\1", script)  # Bold
-    script = re.sub(r"\*([^*]+)\*", r"\1", script)  # Italic
-    script = re.sub(r"__([^_]+)__", r"\1", script)  # Bold (underscore)
-    script = re.sub(r"_([^_]+)_", r"\1", script)  # Italic (underscore)
-    script = re.sub(r"#+\s*", "", script)  # Headers
-    script = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", script)  # Links [text](url) -> text
-    script = re.sub(r"`([^`]+)`", r"\1", script)  # Inline code
+    # Remove markdown code blocks and formatting in a single pass
+    script = _MARKDOWN_RE.sub(_strip_markdown_match, script)
     
     # Remove common response prefixes (case-insensitive)
-    prefixes = [
-        r"^here's the script:?\s*",
-        r"^script:?\s*",
-        r"^here is the script:?\s*",
-        r"^the script:?\s*",
-        r"^script for the video:?\s*",
-        r"^video script:?\s*",
-        r"^narration:?\s*",
-        r"^voiceover:?\s*",
-    ]
-    for prefix in prefixes:
-        script = re.sub(prefix, "", script, flags=re.IGNORECASE)
+    script = _RESPONSE_PREFIX_RE.sub("", script)
     
     # Remove lines that are just formatting or metadata
     lines = script.split("\n")
@@ -2015,12 +2529,11 @@ def clean_script_for_tts(script: str) -> str:
         # Skip empty lines, markdown list markers, and metadata lines
         if not line:
             continue
-        if re.match(r"^[-*+]\s+", line):  # List markers
-            line = re.sub(r"^[-*+]\s+", "", line)
-        if re.match(r"^\d+\.\s+", line):  # Numbered list
-            line = re.sub(r"^\d+\.\s+", "", line)
+        line = _BULLET_MARKER_RE.sub("", line)  # List markers
+        line = _NUMBERED_MARKER_RE.sub("", line)  # Numbered list
         # Skip lines that look like metadata or instructions
-        if any(skip in line.lower() for skip in ["requirements:", "note:", "instructions:", "duration:", "target:"]):
+        line_lower = line.lower()
+        if any(skip in line_lower for skip in _METADATA_LINE_MARKERS):
             continue
         cleaned_lines.append(line)
     
@@ -2028,43 +2541,28 @@ def clean_script_for_tts(script: str) -> str:
     script = " ".join(cleaned_lines)
     
     # Remove extra whitespace
-    script = re.sub(r"\s+", " ", script)
+    script = _WHITESPACE_RE.sub(" ", script)
     script = script.strip()
     
     # Remove trailing punctuation issues
-    script = re.sub(r"\s+([.!?])+", r"\1", script)  # Multiple punctuation -> single
+    script = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", script)  # Multiple punctuation -> single
     
     # Replace "AI" with "Artificial Intelligence" for better TTS pronunciation
     # Use word boundaries to match "AI" as a standalone word, not part of other words
     # Handle possessive case first: "AI's" -> "Artificial Intelligence's"
-    script = re.sub(r'\bAI\'s\b', "Artificial Intelligence's", script, flags=re.IGNORECASE)
+    script = _AI_POSSESSIVE_RE.sub("Artificial Intelligence's", script)
     # Then handle standalone "AI" -> "Artificial Intelligence"
-    script = re.sub(r'\bAI\b', 'Artificial Intelligence', script, flags=re.IGNORECASE)
+    script = _AI_WORD_RE.sub('Artificial Intelligence', script)
     
     return script
 
 
-def generate_script_with_gemini(article: ArticleCandidate, config: Config, max_retries: int = 3) -> Optional[str]:
-    """Generate script using Google Gemini API with retry logic."""
-    if not config.use_gemini or not config.gemini_api_key:
-        return None
-    
-    if genai is None:
-        logging.warning("google-generativeai not available")
-        return None
-    
-    genai.configure(api_key=config.gemini_api_key)
-    model = genai.GenerativeModel(config.gemini_model)
-    
-    # Calculate target word count (2.5 words per second for natural speech)
-    target_words = min(config.max_script_words, 150)  # Cap at 150 words for 60 seconds
-    
-    prompt = textwrap.dedent(f"""
+GEMINI_SCRIPT_PROMPT = textwrap.dedent("""
     Create an engaging 45-60 second script for a vertical video about this AI news story.
     
-    Story Title: {article.title}
-    Source: {article.source}
-    Summary: {article.summary[:500]}
+    Story Title: {title}
+    Source: {source}
+    Summary: {summary}
     
     Requirements:
     - Start with a compelling hook that grabs attention (15-20 words)
@@ -2082,13 +2580,111 @@ def generate_script_with_gemini(article: ArticleCandidate, config: Config, max_r
     - Write the script as natural, conversational text that flows well when spoken.
     - Do not include phrases like "Here's the script:" or "Script:" - just return the script text directly.
     """).strip()
-    
-    for attempt in range(max_retries):
-        try:
-            response = model.generate_content(prompt)
-            raw_script = response.text.strip()
-            
-            if raw_script:
+
+
+@functools.lru_cache(maxsize=4)
+def get_gemini_model(api_key: str, model_name: str):
+    """Configure the Gemini client and build the model once per (key, model)."""
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+
+SCRIPT_CACHE_TTL = timedelta(days=3)  # News goes stale quickly; don't reuse older scripts
+SCRIPT_SIMILARITY_THRESHOLD = 0.8  # Jaccard similarity of title+summary words
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _script_cache_tokens(article: ArticleCandidate) -> Set[str]:
+    """Lowercased words of the title and summary start, for near-duplicate matching."""
+    return set(_TOKEN_RE.findall(f"{article.title} {article.summary[:500]}".lower()))
+
+
+def find_similar_cached_script(tokens: Set[str], config: Config) -> Optional[str]:
+    """Return a recent cached Gemini script for a near-duplicate article, if any.
+    
+    Compares word-set Jaccard similarity against every cache entry younger than
+    SCRIPT_CACHE_TTL (generated with the same model and word limit); expired
+    entries are deleted along the way.
+    """
+    if not tokens or not config.script_cache_dir.exists():
+        return None
+    
+    cutoff = time.time() - SCRIPT_CACHE_TTL.total_seconds()
+    best_score, best_script = 0.0, None
+    for entry_file in config.script_cache_dir.glob("*.json"):
+        try:
+            if entry_file.stat().st_mtime < cutoff:
+                entry_file.unlink(missing_ok=True)
+                continue
+            entry = orjson.loads(entry_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            continue
+        if (entry.get("model") != config.gemini_model
+                or entry.get("max_words") != config.max_script_words
+                or not entry.get("script")):
+            continue
+        entry_tokens = set(entry.get("tokens") or ())
+        if not entry_tokens:
+            continue
+        score = len(tokens & entry_tokens) / len(tokens | entry_tokens)
+        if score > best_score:
+            best_score, best_script = score, entry["script"]
+    
+    if best_script and best_score >= SCRIPT_SIMILARITY_THRESHOLD:
+        logging.info("Reusing Gemini script from a near-duplicate article (similarity %.2f)", best_score)
+        return best_script
+    return None
+
+
+def generate_script_with_gemini(article: ArticleCandidate, config: Config, max_retries: int = 3) -> Optional[str]:
+    """Generate script using Google Gemini API with retry logic."""
+    if not config.use_gemini or not config.gemini_api_key:
+        return None
+    
+    if genai is None:
+        logging.warning("google-generativeai not available")
+        return None
+    
+    model = get_gemini_model(config.gemini_api_key, config.gemini_model)
+    
+    # Calculate target word count (2.5 words per second for natural speech)
+    target_words = min(config.max_script_words, 150)  # Cap at 150 words for 60 seconds
+    
+    prompt = GEMINI_SCRIPT_PROMPT.format(
+        title=article.title,
+        source=article.source,
+        summary=article.summary[:500],
+        target_words=target_words,
+    )
+    
+    # The prompt embeds the article content and the template itself, so hashing it (plus the
+    # model and word limit) invalidates cached scripts whenever any input changes
+    cache_key = hashlib.blake2b(
+        f"{config.gemini_model}|{config.max_script_words}|{prompt}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+    cache_file = config.script_cache_dir / f"{cache_key}.json"
+    try:
+        cached_script = orjson.loads(cache_file.read_bytes()).get("script")
+        if cached_script:
+            logging.info("Using cached Gemini script (%d words)", count_script_words(cached_script))
+            return cached_script
+    except FileNotFoundError:
+        pass
+    except (OSError, orjson.JSONDecodeError, AttributeError) as exc:
+        logging.debug("Ignoring unreadable Gemini script cache entry %s: %s", cache_file.name, exc)
+    
+    # Near-duplicate coverage of the same story (reworded title/summary) reuses its script too
+    article_tokens = _script_cache_tokens(article)
+    similar_script = find_similar_cached_script(article_tokens, config)
+    if similar_script:
+        return similar_script
+    
+    for attempt in range(max_retries):
+        try:
+            response = model.generate_content(prompt)
+            raw_script = response.text.strip()
+            
+            if raw_script:
                 # Clean the script to remove markdown and response prefixes
                 script = clean_script_for_tts(raw_script)
                 
@@ -2097,11 +2693,11 @@ def generate_script_with_gemini(article: ArticleCandidate, config: Config, max_r
                     return None
                 
                 # Enforce word limit
-                word_count = len(script.split())
+                word_count = count_script_words(script)
                 if word_count > config.max_script_words:
                     logging.warning("Script too long (%d words), truncating to %d words", word_count, config.max_script_words)
                     script = truncate_script_to_word_limit(script, config.max_script_words)
-                    word_count = len(script.split())
+                    word_count = count_script_words(script)
                 
                 # Log token usage if available (debug only)
                 if hasattr(response, 'usage_metadata'):
@@ -2111,6 +2707,20 @@ def generate_script_with_gemini(article: ArticleCandidate, config: Config, max_r
                                usage.candidates_token_count if hasattr(usage, 'candidates_token_count') else 0)
                 
                 logging.info("Generated script using Gemini API (%d words)", word_count)
+                try:
+                    config.script_cache_dir.mkdir(parents=True, exist_ok=True)
+                    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.part")
+                    tmp_file.write_bytes(orjson.dumps({
+                        "script": script,
+                        "title": article.title,
+                        "model": config.gemini_model,
+                        "max_words": config.max_script_words,
+                        "tokens": sorted(article_tokens),
+                        "created": time.time(),
+                    }))
+                    os.replace(tmp_file, cache_file)
+                except OSError as exc:
+                    logging.debug("Failed to cache Gemini script: %s", exc)
                 return script
             else:
                 logging.warning("Gemini API returned empty script")
@@ -2129,6 +2739,21 @@ def generate_script_with_gemini(article: ArticleCandidate, config: Config, max_r
     return None
 
 
+def wrap_script(script: str, width: int = 90) -> str:
+    """Wrap a script for display at width columns.
+    
+    textwrap's hyphen-splitting regex can backtrack badly on very long tokens (URLs,
+    unbroken strings), so hyphen breaking is off and scripts containing a token
+    at least `width` long are returned unwrapped.
+    """
+    words = script.split()
+    if not words or len(script) <= width:
+        return script
+    if max(map(len, words)) >= width:
+        return script
+    return textwrap.fill(script, width=width, break_on_hyphens=False)
+
+
 def generate_script(article: ArticleCandidate, config: Config) -> str:
     """Generate script with Gemini API fallback to template."""
     # Try Gemini API first
@@ -2136,12 +2761,11 @@ def generate_script(article: ArticleCandidate, config: Config) -> str:
         gemini_script = generate_script_with_gemini(article, config)
         if gemini_script:
             # Script is already cleaned, just format for display
-            return textwrap.fill(gemini_script, width=90)
+            return wrap_script(gemini_script)
         logging.debug("Falling back to template-based script generation")
     
     # Fallback to template-based script
-    title_lower = article.title.lower()
-    if any(ai_term in title_lower for ai_term in ["ai", "artificial intelligence", "machine learning", "gpt", "claude"]):
+    if article.title_mentions_ai:
         hook = f"Breaking AI news: {article.title}."
     else:
         hook = f"Breaking AI news from {article.source}: {article.title}."
@@ -2158,14 +2782,14 @@ def generate_script(article: ArticleCandidate, config: Config) -> str:
     script = clean_script_for_tts(script)
     
     # Enforce word limit for template scripts too
-    word_count = len(script.split())
+    word_count = count_script_words(script)
     if word_count > config.max_script_words:
         logging.warning("Template script too long (%d words), truncating to %d words", word_count, config.max_script_words)
         script = truncate_script_to_word_limit(script, config.max_script_words)
-        word_count = len(script.split())
+        word_count = count_script_words(script)
     
     logging.info("Generated script using template (%d words)", word_count)
-    return textwrap.fill(script, width=90)
+    return wrap_script(script)
 
 
 def generate_metadata(article: ArticleCandidate, script: str) -> Dict[str, str]:
@@ -2177,21 +2801,17 @@ def generate_metadata(article: ArticleCandidate, script: str) -> Dict[str, str]:
     description = f"{article.summary}\nRead more: {article.url}\n" + " ".join(hashtags)
     
     # Extract AI-related tags from article
-    text_lower = article.title.lower() + " " + article.summary.lower()
-    ai_tags = []
-    for keyword in AI_KEYWORDS.keys():
-        if keyword.lower() in text_lower and keyword not in ai_tags:
-            # Use simplified tag versions
-            tag = keyword.replace(" ", "").replace("-", "").lower()
-            if len(tag) <= 20:  # Keep tags reasonable length
-                ai_tags.append(tag)
+    text_lower = article.text_lower
+    # Use simplified tag versions
+    simplified = (keyword.replace(" ", "").replace("-", "") for keyword in _AI_KEYWORD_RE.findall(text_lower))
+    ai_tags = list(dict.fromkeys(tag for tag in simplified if len(tag) <= 20))  # Keep tags reasonable length
     
     # Base tags with AI focus
     tags = ["ai", "artificialintelligence", "machinelearning", "tech", "news", article.source.lower()] + ai_tags[:5]
     
     # Title with AI context
     title = article.title
-    if not any(ai_term in title.lower() for ai_term in ["ai", "artificial intelligence", "machine learning"]):
+    if not article.title_mentions_ai:
         title = f"AI News: {title}"
     title = f"{title} — Explained in 60s"
     
@@ -2204,6 +2824,30 @@ def generate_metadata(article: ArticleCandidate, script: str) -> Dict[str, str]:
     return metadata
 
 
+def wrap_words_to_width(draw: ImageDraw.ImageDraw, words: List[str], font, max_width: float) -> List[str]:
+    """Greedily pack words into lines no wider than max_width pixels.
+    
+    Each word is measured once and line widths are summed, instead of re-measuring
+    every candidate line.
+    """
+    space_width = draw.textlength(" ", font=font)
+    lines: List[str] = []
+    current: List[str] = []
+    current_width = 0.0
+    for word, word_width in zip(words, [draw.textlength(word, font=font) for word in words]):
+        test_width = current_width + space_width + word_width if current else word_width
+        if test_width <= max_width or not current:
+            current.append(word)
+            current_width = test_width
+        else:
+            lines.append(" ".join(current))
+            current = [word]
+            current_width = word_width
+    if current:
+        lines.append(" ".join(current))
+    return lines
+
+
 def create_thumbnail(article: ArticleCandidate, title: str, output_path: Path, config: Config) -> Optional[Path]:
     """Create a captivating thumbnail with bold text and cool gradient for YouTube Shorts.
     
@@ -2221,10 +2865,6 @@ def create_thumbnail(article: ArticleCandidate, title: str, output_path: Path, c
         thumbnail_width = 1080
         thumbnail_height = 1920
         
-        # Create base image
-        img = Image.new('RGB', (thumbnail_width, thumbnail_height), color='#1a1a2e')
-        draw = ImageDraw.Draw(img)
-        
         # Cool gradient color combinations
         gradients = [
             # Purple to Blue
@@ -2252,13 +2892,9 @@ def create_thumbnail(article: ArticleCandidate, title: str, output_path: Path, c
         # Randomly select a gradient
         start_color, end_color = random.choice(gradients)
         
-        # Create vertical gradient background
-        for y in range(thumbnail_height):
-            ratio = y / thumbnail_height
-            r = int(start_color[0] + (end_color[0] - start_color[0]) * ratio)
-            g = int(start_color[1] + (end_color[1] - start_color[1]) * ratio)
-            b = int(start_color[2] + (end_color[2] - start_color[2]) * ratio)
-            draw.line([(0, y), (thumbnail_width, y)], fill=(r, g, b))
+        # Create vertical gradient background in one vectorized pass
+        img = Image.fromarray(vertical_gradient_array(thumbnail_width, thumbnail_height, start_color, end_color), 'RGB')
+        draw = ImageDraw.Draw(img)
         
         # Get Coiny font for bold text
         font_path = get_coiny_font_path(config)
@@ -2269,40 +2905,22 @@ def create_thumbnail(article: ArticleCandidate, title: str, output_path: Path, c
         if len(title) > 60:
             thumbnail_text = title[:57] + "..."
         
-        # Split text into lines if needed (max 3 lines for vertical format)
+        # Split text into lines by rendered width (max 3 lines for vertical format)
         words = thumbnail_text.split()
-        lines = []
-        current_line = ""
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            if len(test_line) <= 35:  # ~35 chars per line for vertical format
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
+        max_text_width = thumbnail_width - 2 * 60
+        if font_path:
+            # Use Coiny font - the largest size whose wrap fits its line budget
+            for font_size, max_lines in ((120, 1), (100, 2), (85, 3)):
+                font = load_font(font_path, font_size)
+                lines = wrap_words_to_width(draw, words, font, max_text_width)
+                if len(lines) <= max_lines:
+                    break
+        else:
+            # Fallback to default bold font
+            font = load_font("arial.ttf", 120)
+            lines = wrap_words_to_width(draw, words, font, max_text_width)
         lines = lines[:3]  # Max 3 lines for vertical format
         
-        # Draw text with bold styling
-        try:
-            if font_path:
-                # Use Coiny font - larger size for vertical format
-                font_size = 120 if len(lines) == 1 else (100 if len(lines) == 2 else 85)
-                try:
-                    font = ImageFont.truetype(font_path, font_size)
-                except:
-                    font = ImageFont.load_default()
-            else:
-                # Fallback to default bold font
-                try:
-                    font = ImageFont.truetype("arial.ttf", 120)
-                except:
-                    font = ImageFont.load_default()
-        except:
-            font = ImageFont.load_default()
-        
         # Calculate text position (centered vertically)
         total_text_height = len(lines) * 140  # Approximate line height
         text_y_start = thumbnail_height // 2 - total_text_height // 2
@@ -2318,20 +2936,14 @@ def create_thumbnail(article: ArticleCandidate, title: str, output_path: Path, c
             text_x = (thumbnail_width - text_width) // 2
             text_y = text_y_start + (line_idx * 140)
             
-            # Draw black outline (shadow) - draw multiple times for thicker outline
+            # Draw white text with a black outline (shadow) in a single stroked pass
             outline_color = (0, 0, 0)
             outline_thickness = 4
-            for adj in [(-outline_thickness, -outline_thickness), (-outline_thickness, outline_thickness), 
-                       (outline_thickness, -outline_thickness), (outline_thickness, outline_thickness),
-                       (-outline_thickness, 0), (outline_thickness, 0), (0, -outline_thickness), (0, outline_thickness),
-                       (-2, -2), (-2, 2), (2, -2), (2, 2)]:
-                draw.text((text_x + adj[0], text_y + adj[1]), line, font=font, fill=outline_color)
-            
-            # Draw white text on top
-            draw.text((text_x, text_y), line, font=font, fill='#FFFFFF')
+            draw.text((text_x, text_y), line, font=font, fill='#FFFFFF',
+                      stroke_width=outline_thickness, stroke_fill=outline_color)
         
         # Save thumbnail
-        img.save(str(output_path), 'PNG', quality=95)
+        img.save(str(output_path), 'PNG', compress_level=1, optimize=False)
         logging.debug("Created thumbnail: %s", output_path.name)
         return output_path
         
@@ -2340,25 +2952,44 @@ def create_thumbnail(article: ArticleCandidate, title: str, output_path: Path, c
         return None
 
 
-def find_youtube_channel(youtube, channel_name: str) -> Optional[str]:
+_YOUTUBE_CHANNELS: Dict[str, List[Dict]] = {}
+_YOUTUBE_CHANNELS_LOCK = threading.Lock()
+
+
+def list_youtube_channels(youtube, account_key: str) -> List[Dict]:
+    """List the authenticated account's channels, once per account per process.
+    
+    The service object is rebuilt for every upload attempt, so the cache is keyed by
+    the account (refresh token) rather than the service.
+    """
+    with _YOUTUBE_CHANNELS_LOCK:
+        channels = _YOUTUBE_CHANNELS.get(account_key)
+    if channels is None:
+        channels_response = youtube.channels().list(
+            part="snippet,id",
+            mine=True,
+            maxResults=50
+        ).execute()
+        channels = channels_response.get("items", [])
+        with _YOUTUBE_CHANNELS_LOCK:
+            _YOUTUBE_CHANNELS[account_key] = channels
+    return channels
+
+
+def find_youtube_channel(youtube, channel_name: str, account_key: str = "") -> Optional[str]:
     """Find YouTube channel ID by channel name or handle.
     
     Args:
         youtube: Authenticated YouTube API service object
         channel_name: Channel name (e.g., "Code Rush") or handle (e.g., "@CodeRush_AI")
+        account_key: Identifies the authenticated account for the channel list cache
         
     Returns:
         Channel ID if found, None otherwise
     """
     try:
         # List all channels accessible by the authenticated user
-        channels_response = youtube.channels().list(
-            part="snippet,id",
-            mine=True,
-            maxResults=50
-        ).execute()
-        
-        channels = channels_response.get("items", [])
+        channels = list_youtube_channels(youtube, account_key)
         
         if not channels:
             logging.warning("No channels found for authenticated account")
@@ -2414,6 +3045,9 @@ def find_youtube_channel(youtube, channel_name: str) -> Optional[str]:
         return None
 
 
+YOUTUBE_RESUMABLE_MIN_MB = 5.0  # Below this a single-shot upload beats a resumable session
+
+
 def upload_to_youtube(video_path: Path, title: str, description: str, tags: str, config: Config, thumbnail_path: Optional[Path] = None, max_retries: int = 3) -> Optional[str]:
     """Upload video to YouTube using OAuth 2.0 and YouTube Data API v3.
     
@@ -2475,7 +3109,8 @@ def upload_to_youtube(video_path: Path, title: str, description: str, tags: str,
             target_channel_id = None
             if config.youtube_channel_name:
                 logging.info("Looking for YouTube channel: '%s'", config.youtube_channel_name)
-                target_channel_id = find_youtube_channel(youtube, config.youtube_channel_name)
+                target_channel_id = find_youtube_channel(youtube, config.youtube_channel_name,
+                                                         config.youtube_refresh_token or "")
                 if target_channel_id:
                     logging.info("Will upload to channel ID: %s", target_channel_id)
                 else:
@@ -2484,14 +3119,10 @@ def upload_to_youtube(video_path: Path, title: str, description: str, tags: str,
             else:
                 # Get default channel
                 try:
-                    channels_response = youtube.channels().list(
-                        part="snippet,id",
-                        mine=True,
-                        maxResults=1
-                    ).execute()
-                    if channels_response.get("items"):
-                        target_channel_id = channels_response["items"][0]["id"]
-                        channel_title = channels_response["items"][0].get("snippet", {}).get("title", "Unknown")
+                    channels = list_youtube_channels(youtube, config.youtube_refresh_token or "")
+                    if channels:
+                        target_channel_id = channels[0]["id"]
+                        channel_title = channels[0].get("snippet", {}).get("title", "Unknown")
                         logging.info("Using default channel: '%s' (ID: %s)", channel_title, target_channel_id)
                 except Exception as exc:
                     logging.warning("Could not determine channel, proceeding with upload: %s", exc)
@@ -2510,11 +3141,12 @@ def upload_to_youtube(video_path: Path, title: str, description: str, tags: str,
                 },
             }
             
-            # Prepare media file upload with resumable upload
+            # Small files go up in a single request; resumable sessions cost an extra round trip
+            resumable = file_size_mb >= YOUTUBE_RESUMABLE_MIN_MB
             media = MediaFileUpload(
                 str(video_path),
                 chunksize=-1,  # Use default chunk size for resumable uploads
-                resumable=True,
+                resumable=resumable,
             )
             
             # Insert video
@@ -2528,8 +3160,8 @@ def upload_to_youtube(video_path: Path, title: str, description: str, tags: str,
                 media_body=media,
             )
             
-            # Execute resumable upload
-            response = None
+            # Execute upload (resumable uploads report progress per chunk)
+            response = None if resumable else insert_request.execute()
             chunk_count = 0
             while response is None:
                 status, response = insert_request.next_chunk()
@@ -2718,7 +3350,7 @@ def upload_to_tiktok(video_path: Path, title: str, config: Config, max_retries:
                 },
             }
             
-            init_response = requests.post(
+            init_response = _HTTP_SESSION.post(
                 f"{base_url}post/publish/video/init/",
                 headers=headers,
                 json=init_payload,
@@ -2748,41 +3380,50 @@ def upload_to_tiktok(video_path: Path, title: str, config: Config, max_retries:
             if file_size > chunk_size:
                 # Chunked upload
                 logging.debug("Uploading video in chunks (%.2f MB)...", file_size_mb)
-                with open(video_path, "rb") as f:
-                    chunk_num = 0
-                    while True:
-                        chunk = f.read(chunk_size)
-                        if not chunk:
-                            break
-                        
-                        chunk_headers = {
-                            "Content-Type": "video/mp4",
-                            "Content-Range": f"bytes {chunk_num * chunk_size}-{chunk_num * chunk_size + len(chunk) - 1}/{file_size}",
-                        }
-                        
-                        chunk_response = requests.put(
-                            upload_url,
-                            headers=chunk_headers,
-                            data=chunk,
-                            timeout=60,
-                        )
-                        chunk_response.raise_for_status()
-                        chunk_num += 1
-                        logging.debug("Uploaded chunk %d", chunk_num)
+                # Send zero-copy slices of a read-only mapping instead of 20 MB bytes buffers
+                with open(video_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        for chunk_num, start in enumerate(range(0, file_size, chunk_size), start=1):
+                            end = min(start + chunk_size, file_size)
+                            chunk_headers = {
+                                "Content-Type": "video/mp4",
+                                "Content-Range": f"bytes {start}-{end - 1}/{file_size}",
+                            }
+                            
+                            # Release each slice explicitly: the response keeps the request body
+                            # alive, and a live export would make closing the mmap raise BufferError
+                            with view[start:end] as chunk:
+                                chunk_response = _HTTP_SESSION.put(
+                                    upload_url,
+                                    headers=chunk_headers,
+                                    data=chunk,
+                                    timeout=60,
+                                )
+                                chunk_response.raise_for_status()
+                                del chunk_response
+                            logging.debug("Uploaded chunk %d", chunk_num)
+                    finally:
+                        view.release()
             else:
                 # Single upload
                 logging.debug("Uploading video file (%.2f MB)...", file_size_mb)
-                with open(video_path, "rb") as f:
+                with open(video_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
                     upload_headers = {
                         "Content-Type": "video/mp4",
                     }
-                    upload_response = requests.put(
-                        upload_url,
-                        headers=upload_headers,
-                        data=f.read(),
-                        timeout=60,
-                    )
-                    upload_response.raise_for_status()
+                    view = memoryview(mm)
+                    try:
+                        upload_response = _HTTP_SESSION.put(
+                            upload_url,
+                            headers=upload_headers,
+                            data=view,
+                            timeout=60,
+                        )
+                        upload_response.raise_for_status()
+                        del upload_response
+                    finally:
+                        view.release()
             
             logging.debug("Video file uploaded successfully")
             
@@ -2791,7 +3432,7 @@ def upload_to_tiktok(video_path: Path, title: str, config: Config, max_retries:
             poll_interval = 3  # Poll every 3 seconds
             
             for poll_attempt in range(max_poll_attempts):
-                status_response = requests.post(
+                status_response = _HTTP_SESSION.post(
                     f"{base_url}post/publish/status/fetch/",
                     headers=headers,
                     json={"publish_id": publish_id},
@@ -3089,7 +3730,7 @@ def generate_search_queries(article: ArticleCandidate, keywords: List[str]) -> L
         List of search queries ordered by specificity (most specific first)
     """
     queries = []
-    text_lower = f"{article.title} {article.summary}".lower()
+    text_lower = article.text_lower
     
     # Query 1: Most specific - combine keywords with tech context
     if keywords:
@@ -3173,7 +3814,7 @@ def fetch_stock_video(keywords: List[str], config: Config, count: int = 3, used_
                     "page": 1  # Start with most relevant results
                 }
                 
-                response = requests.get(url, headers=headers, params=params, timeout=10)
+                response = _HTTP_SESSION.get(url, headers=headers, params=params, timeout=10)
                 response.raise_for_status()
                 if response.status_code == 200:
                     data = response.json()
@@ -3282,7 +3923,7 @@ def fetch_stock_media(keywords: List[str], config: Config, media_type: str = "ph
                 "orientation": "portrait",
                 "page": random_page
             }
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = _HTTP_SESSION.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             if response.status_code == 200:
                 data = response.json()
@@ -3329,7 +3970,7 @@ def fetch_stock_media(keywords: List[str], config: Config, media_type: str = "ph
                 "per_page": per_page,
                 "page": random_page,
             }
-            response = requests.get(url, params=params, timeout=10)
+            response = _HTTP_SESSION.get(url, params=params, timeout=10)
             response.raise_for_status()
             if response.status_code == 200:
                 data = response.json()
@@ -3375,7 +4016,7 @@ def fetch_stock_media(keywords: List[str], config: Config, media_type: str = "ph
                 "orientation": "portrait",
                 "page": random_page
             }
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = _HTTP_SESSION.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             if response.status_code == 200:
                 data = response.json()
@@ -3410,6 +4051,148 @@ def fetch_stock_media(keywords: List[str], config: Config, media_type: str = "ph
     return results[:count]
 
 
+def link_or_copy(src: Path, dest: Path) -> Path:
+    """Hardlink src to dest, falling back to a copy across filesystems."""
+    try:
+        if dest.exists():
+            dest.unlink()
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+    return dest
+
+
+MEDIA_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+
+def evict_lru_files(entries: List[Path], max_bytes: int) -> None:
+    """Delete the least recently used files (by mtime) once their total size exceeds max_bytes."""
+    sized = []
+    for entry in entries:
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        sized.append((stat.st_mtime, stat.st_size, entry))
+    total = 0
+    for _, size, entry in sorted(sized, key=operator.itemgetter(0), reverse=True):
+        total += size
+        if total > max_bytes:
+            entry.unlink(missing_ok=True)
+
+
+def trim_media_cache(config: Config) -> None:
+    """Cap the downloaded and normalized stock media in config.cache_dir at MEDIA_CACHE_MAX_BYTES.
+    
+    Runs once per run before story workers start, so no entry is evicted while in use.
+    """
+    if not config.cache_dir.is_dir():
+        return
+    # Narration AAC used to be cached here too; drop what older runs left behind
+    shutil.rmtree(config.cache_dir / "audio", ignore_errors=True)
+    evict_lru_files([entry for entry in config.cache_dir.iterdir() if entry.is_file()], MEDIA_CACHE_MAX_BYTES)
+
+
+def fetch_cached_media(url: str, suffix: str, config: Config, timeout: int = 30) -> Optional[Path]:
+    """Return a local copy of url from the persistent media cache, downloading on a miss.
+
+    Cache entries are keyed by sha1(url) so the same Pexels/Pixabay asset is only
+    fetched once across all videos (and runs) sharing config.cache_dir.
+    """
+    cache_file = config.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}{suffix}"
+    if cache_file.exists() and cache_file.stat().st_size >= 1000:
+        logging.debug("Media cache hit: %s", cache_file.name)
+        os.utime(cache_file)  # Mark as recently used
+        return cache_file
+
+    config.cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.part")
+    try:
+        response = _HTTP_SESSION.get(url, timeout=timeout, stream=True)
+        response.raise_for_status()
+
+        # Download with size verification
+        total_size = 0
+        expected_size = int(response.headers.get('content-length', 0))
+        with open(tmp_file, "wb") as f:
+            for chunk in response.iter_content(chunk_size=65536):
+                if chunk:
+                    f.write(chunk)
+                    total_size += len(chunk)
+
+        # Verify download completed
+        if expected_size > 0 and total_size < expected_size:
+            logging.warning("Media download incomplete: %d/%d bytes", total_size, expected_size)
+            return None
+        # Verify file is not empty and has reasonable size
+        if total_size < 1000:  # Less than 1KB is suspicious
+            logging.warning("Downloaded media file is too small, likely corrupted")
+            return None
+
+        os.replace(tmp_file, cache_file)
+        return cache_file
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+
+def normalize_stock_video(video_path: Path, width: int = 1080, height: int = 1920) -> Path:
+    """Scale and center-crop a stock video to width x height once with ffmpeg.
+    
+    The normalized file sits next to the source (so cached downloads keep their
+    normalized copy too) and lets MoviePy skip per-frame resize/crop at render time.
+    
+    Returns:
+        Path to the normalized video, or the original path if ffmpeg failed
+    """
+    normalized_path = video_path.with_name(f"{video_path.stem}_{width}x{height}.mp4")
+    if normalized_path.exists() and normalized_path.stat().st_size >= 1000:
+        os.utime(normalized_path)  # Mark as recently used
+        return normalized_path
+    
+    tmp_file = normalized_path.with_name(f"{normalized_path.stem}.{os.getpid()}.{threading.get_ident()}.mp4")
+    cmd = [
+        "ffmpeg",
+        "-i", str(video_path),
+        "-vf", f"scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height}",
+        "-c:v", "libx264",
+        # Intermediate only: it is decoded and re-encoded into the final video, so spend
+        # no effort on compression, just keep it near-lossless (also cheaper to decode)
+        "-preset", "ultrafast",
+        "-crf", "18",
+        "-an",  # Stock footage audio is never used
+        "-y",
+        str(tmp_file),
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=120)
+        if result.returncode == 0:
+            os.replace(tmp_file, normalized_path)
+            return normalized_path
+        logging.warning("FFmpeg stock video normalization failed: %s", result.stderr[-500:])
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        logging.warning("FFmpeg stock video normalization failed: %s", exc)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+    return video_path
+
+
+def cover_resize(img: Image.Image, width: int, height: int) -> Image.Image:
+    """Scale and center-crop an image to exactly cover width x height.
+    
+    The crop is passed to resize() as its source box, so LANCZOS only runs over the
+    visible region; JPEGs are also DCT-downscaled on decode (draft) when much larger.
+    """
+    if img.format == "JPEG":
+        img.draft("RGB", (width, height))  # Keeps at least width x height
+    img = img.convert("RGB")
+    scale = max(width / img.width, height / img.height)
+    box_width, box_height = width / scale, height / scale
+    left = (img.width - box_width) / 2
+    top = (img.height - box_height) / 2
+    return img.resize((width, height), Image.Resampling.LANCZOS,
+                      box=(left, top, left + box_width, top + box_height))
+
+
 def prepare_stock_media(article: ArticleCandidate, config: Config, tmp_path: Path, count: int = 5) -> Tuple[List[str], List[Path]]:
     """Prepare stock media (videos and images) for video assembly with reuse prevention.
     Returns: (list_of_video_paths, list_of_image_paths)"""
@@ -3418,41 +4201,23 @@ def prepare_stock_media(article: ArticleCandidate, config: Config, tmp_path: Pat
     image_paths = []
     used_media_ids_to_save = []  # Track IDs to save after successful download
     
-    # Load previously used media IDs to avoid reuse
-    used_media_ids = load_used_media_ids(config)
+    # Load previously used media IDs (and those claimed by other stories this run) to avoid reuse
+    used_media_ids = load_used_media_ids(config) | claimed_media_ids()
     
     # Try to fetch multiple stock videos first (most engaging)
     if config.pexels_api_key:
         video_results = fetch_stock_video(keywords, config, count=count, used_media_ids=used_media_ids, article=article)  # Returns (url, media_id) tuples
+        video_results = claim_media(video_results)
         
         # Download videos in parallel for faster processing
         def download_video(video_data):
             index, video_url, media_id = video_data
             try:
-                video_file = tmp_path / f"stock_video_{index}.mp4"
-                response = requests.get(video_url, timeout=30, stream=True)
-                response.raise_for_status()
-                
-                # Download with size verification
-                total_size = 0
-                expected_size = int(response.headers.get('content-length', 0))
-                
-                with open(video_file, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            total_size += len(chunk)
-                
-                # Verify download completed
-                if expected_size > 0 and total_size < expected_size:
-                    logging.warning("Video download incomplete: %d/%d bytes", total_size, expected_size)
-                    return None, None
-                
-                # Verify file is not empty and has reasonable size
-                if video_file.stat().st_size < 1000:  # Less than 1KB is suspicious
-                    logging.warning("Downloaded video file is too small, likely corrupted")
+                cached_file = fetch_cached_media(video_url, ".mp4", config, timeout=30)
+                if cached_file is None:
                     return None, None
-                
+                cached_file = normalize_stock_video(cached_file)
+                video_file = link_or_copy(cached_file, tmp_path / f"stock_video_{index}.mp4")
                 return str(video_file), media_id
             except Exception as exc:
                 logging.warning("Failed to download stock video %d: %s", index+1, exc)
@@ -3476,29 +4241,18 @@ def prepare_stock_media(article: ArticleCandidate, config: Config, tmp_path: Pat
     
     # Fetch multiple stock images
     stock_image_results = fetch_stock_media(keywords, config, media_type="photo", count=count, used_media_ids=used_media_ids)  # Returns (url, media_id) tuples
+    stock_image_results = claim_media(stock_image_results)
     target_width, target_height = 1080, 1920
     
     # Download and process images in parallel for faster processing
     def download_and_process_image(image_data):
         index, image_url, media_id = image_data
         try:
-            response = requests.get(image_url, timeout=15)
-            response.raise_for_status()
-            img = Image.open(BytesIO(response.content))
-            img = img.convert("RGB")
-            
-            # Resize to cover 1080x1920
-            img_ratio = img.width / img.height
-            target_ratio = target_width / target_height
-            
-            if img_ratio > target_ratio:
-                img = img.resize((int(target_height * img_ratio), target_height), Image.Resampling.LANCZOS)
-                left = (img.width - target_width) // 2
-                img = img.crop((left, 0, left + target_width, target_height))
-            else:
-                img = img.resize((target_width, int(target_width / img_ratio)), Image.Resampling.LANCZOS)
-                top = (img.height - target_height) // 2
-                img = img.crop((0, top, target_width, top + target_height))
+            cached_file = fetch_cached_media(image_url, ".jpg", config, timeout=15)
+            if cached_file is None:
+                raise ValueError("image download failed")
+            # Resize to cover 1080x1920, cropping before resampling
+            img = cover_resize(Image.open(cached_file), target_width, target_height)
             
             image_file = tmp_path / f"stock_image_{index}.jpg"
             img.save(image_file, "JPEG", quality=90)
@@ -3526,22 +4280,11 @@ def prepare_stock_media(article: ArticleCandidate, config: Config, tmp_path: Pat
     # Fallback to article image if available
     if article.image_url:
         try:
-            response = requests.get(article.image_url, timeout=10)
-            response.raise_for_status()
-            img = Image.open(BytesIO(response.content))
-            img = img.convert("RGB")
-            
-            img_ratio = img.width / img.height
-            target_ratio = target_width / target_height
-            
-            if img_ratio > target_ratio:
-                img = img.resize((int(target_height * img_ratio), target_height), Image.Resampling.LANCZOS)
-                left = (img.width - target_width) // 2
-                img = img.crop((left, 0, left + target_width, target_height))
-            else:
-                img = img.resize((target_width, int(target_width / img_ratio)), Image.Resampling.LANCZOS)
-                top = (img.height - target_height) // 2
-                img = img.crop((0, top, target_width, top + target_height))
+            cached_file = fetch_cached_media(article.image_url, ".jpg", config, timeout=10)
+            if cached_file is None:
+                raise ValueError("image download failed")
+            # Resize to cover 1080x1920, cropping before resampling
+            img = cover_resize(Image.open(cached_file), target_width, target_height)
             
             image_file = tmp_path / "article_image.jpg"
             img.save(image_file, "JPEG", quality=90)
@@ -3566,26 +4309,11 @@ def ensure_image(path: Path, article: ArticleCandidate, config: Config) -> Path:
     
     if article.image_url:
         try:
-            response = requests.get(article.image_url, timeout=10)
-            response.raise_for_status()
-            # Load and process image to exact 1080x1920
-            img = Image.open(BytesIO(response.content))
-            img = img.convert("RGB")
-            
-            # Resize to cover 1080x1920 while maintaining aspect ratio
-            img_ratio = img.width / img.height
-            target_ratio = target_width / target_height
-            
-            if img_ratio > target_ratio:
-                # Image is wider - fit to height, crop width
-                img = img.resize((int(target_height * img_ratio), target_height), Image.Resampling.LANCZOS)
-                left = (img.width - target_width) // 2
-                img = img.crop((left, 0, left + target_width, target_height))
-            else:
-                # Image is taller - fit to width, crop height
-                img = img.resize((target_width, int(target_width / img_ratio)), Image.Resampling.LANCZOS)
-                top = (img.height - target_height) // 2
-                img = img.crop((0, top, target_width, top + target_height))
+            cached_file = fetch_cached_media(article.image_url, ".jpg", config, timeout=10)
+            if cached_file is None:
+                raise ValueError("image download failed")
+            # Load and process image to exact 1080x1920, cropping before resampling
+            img = cover_resize(Image.open(cached_file), target_width, target_height)
             
             img.save(path, "JPEG", quality=85)
             return path
@@ -3594,28 +4322,17 @@ def ensure_image(path: Path, article: ArticleCandidate, config: Config) -> Path:
     
     # Try stock media first (more engaging)
     keywords = extract_keywords_for_search(article)
-    used_media_ids = load_used_media_ids(config)
-    stock_results = fetch_stock_media(keywords, config, media_type="photo", count=1, used_media_ids=used_media_ids)
+    used_media_ids = load_used_media_ids(config) | claimed_media_ids()
+    stock_results = claim_media(fetch_stock_media(keywords, config, media_type="photo", count=1, used_media_ids=used_media_ids))
     
     if stock_results:
         try:
             image_url, media_id = stock_results[0]  # Unpack tuple (url, media_id)
-            response = requests.get(image_url, timeout=15)
-            response.raise_for_status()
-            img = Image.open(BytesIO(response.content))
-            img = img.convert("RGB")
-            
-            img_ratio = img.width / img.height
-            target_ratio = target_width / target_height
-            
-            if img_ratio > target_ratio:
-                img = img.resize((int(target_height * img_ratio), target_height), Image.Resampling.LANCZOS)
-                left = (img.width - target_width) // 2
-                img = img.crop((left, 0, left + target_width, target_height))
-            else:
-                img = img.resize((target_width, int(target_width / img_ratio)), Image.Resampling.LANCZOS)
-                top = (img.height - target_height) // 2
-                img = img.crop((0, top, target_width, top + target_height))
+            cached_file = fetch_cached_media(image_url, ".jpg", config, timeout=15)
+            if cached_file is None:
+                raise ValueError("image download failed")
+            # Resize to cover 1080x1920, cropping before resampling
+            img = cover_resize(Image.open(cached_file), target_width, target_height)
             
             img.save(path, "JPEG", quality=90)
             # Save the used media ID
@@ -3788,8 +4505,6 @@ def generate_audio_with_edge_tts(script: str, output_path: Path, config: Config)
         return None
     
     try:
-        import asyncio
-        
         # Log Edge-TTS configuration
         logging.info("=" * 60)
         logging.info("Edge-TTS Configuration (Fallback):")
@@ -4047,6 +4762,76 @@ def generate_audio(script: str, output_path: Path, config: Config) -> Optional[P
     return None
 
 
+WHISPER_SAMPLE_RATE = 16000
+_PUNCTUATION_TOKENS = frozenset({".", ",", "!", "?", ":", ";", "-"})
+WHISPER_MIN_DURATION = 10.0  # Seconds of narration below which estimated timings are used
+
+
+def wav_duration(audio_path: Path) -> Optional[float]:
+    """Duration of a WAV file from its header, or None if it is not a readable WAV."""
+    try:
+        with wave.open(str(audio_path), "rb") as wav:
+            rate = wav.getframerate()
+            return wav.getnframes() / rate if rate else None
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+def load_wav_for_whisper(audio_path: Path) -> Optional[np.ndarray]:
+    """Decode the 16-bit PCM narration WAV into 16 kHz mono float32 samples in-process.
+    
+    Saves whisper.load_audio's ffmpeg subprocess (a second full decode and resample).
+    Returns None for anything that is not 16-bit PCM WAV so the caller can fall back.
+    """
+    try:
+        with wave.open(str(audio_path), "rb") as wav:
+            if wav.getsampwidth() != 2:
+                return None
+            channels = wav.getnchannels()
+            rate = wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError, OSError):
+        return None
+    samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    if rate != WHISPER_SAMPLE_RATE and samples.size:
+        # Band-limited FFT resample: dropping the bins above the new Nyquist is the anti-alias filter
+        target_length = max(1, round(samples.size * WHISPER_SAMPLE_RATE / rate))
+        spectrum = np.fft.rfft(samples)[:target_length // 2 + 1]
+        samples = np.fft.irfft(spectrum, target_length) * (target_length / samples.size)
+    return samples.astype(np.float32)
+
+
+_WHISPER_MODEL = None
+_WHISPER_LOCK = threading.Lock()
+WHISPER_MAX_THREADS = 16
+
+
+def _get_whisper_model(whisper):
+    """Load the whisper model once per process and reuse it for every story."""
+    global _WHISPER_MODEL
+    with _WHISPER_LOCK:
+        if _WHISPER_MODEL is None:
+            # Run on the GPU when torch can see one (fp16 decoding); CPU otherwise
+            try:
+                import torch
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+                if device == "cpu":
+                    # Intra-op threads drive the encoder GEMMs; torch's default may not match the host
+                    torch.set_num_threads(max(1, min(WHISPER_MAX_THREADS, _CPU_THREADS)))
+            except Exception:
+                device = "cpu"
+            logging.debug("Loading whisper model on %s", device)
+            # Only word boundaries are needed, so the English-only tiny model suffices;
+            # fallback to base if it cannot be loaded
+            try:
+                _WHISPER_MODEL = whisper.load_model("tiny.en", device=device)
+            except Exception:
+                _WHISPER_MODEL = whisper.load_model("base", device=device)
+        return _WHISPER_MODEL
+
+
 def extract_word_timings(audio_path: Path, script: str, config: Config) -> List[WordTiming]:
     """Extract word-level timings from audio file.
     
@@ -4062,59 +4847,65 @@ def extract_word_timings(audio_path: Path, script: str, config: Config) -> List[
         List of WordTiming objects with word, start_time, end_time
     """
     try:
-        # Try to use whisper-timestamped for accurate word-level timing
-        try:
-            import whisper_timestamped as whisper
-            import torch
-            
-            logging.info("Extracting word timings using whisper-timestamped...")
-            # Try tiny model first (faster), fallback to base if needed
+        # Short narrations are aligned well enough by the estimate below, so whisper's
+        # model load and transcription are skipped for them
+        audio_duration = wav_duration(audio_path)
+        word_count = len(script.split())
+        if not config.enable_whisper_captions:
+            logging.info("Whisper captions disabled, using estimated word timings")
+        elif word_count < config.whisper_min_words or (audio_duration is not None and audio_duration < WHISPER_MIN_DURATION):
+            logging.info("Short narration (%d words), using estimated word timings", word_count)
+        else:
+            # Try to use whisper-timestamped for accurate word-level timing
             try:
-                model = whisper.load_model("tiny", device="cpu")
-            except:
-                model = whisper.load_model("base", device="cpu")
+                import whisper_timestamped as whisper
+                import torch
             
-            audio = whisper.load_audio(str(audio_path))
-            result = whisper.transcribe_timestamped(
-                model, 
-                audio, 
-                language="en",
-                verbose=False
-            )
+                logging.info("Extracting word timings using whisper-timestamped...")
+                model = _get_whisper_model(whisper)
             
-            word_timings = []
-            for segment in result.get("segments", []):
-                for word_info in segment.get("words", []):
-                    word_text = word_info.get("text", "").strip()
-                    start_time = word_info.get("start", 0.0)
-                    end_time = word_info.get("end", 0.0)
-                    
-                    # Skip empty words
-                    if word_text:
-                        word_timings.append(WordTiming(
-                            word=word_text,
-                            start_time=start_time,
-                            end_time=end_time
-                        ))
+                audio = load_wav_for_whisper(audio_path)
+                if audio is None:
+                    audio = whisper.load_audio(str(audio_path))
+                # Greedy, single-temperature decoding: the script is already known, so the
+                # transcript only has to align words. Leaving beam_size/best_of unset keeps
+                # whisper-timestamped on its fast single-pass path.
+                result = whisper.transcribe_timestamped(
+                    model, 
+                    audio, 
+                    language="en",
+                    temperature=0.0,
+                    condition_on_previous_text=False,
+                    verbose=False
+                )
             
-            if word_timings:
-                logging.info("Extracted %d word timings from audio using whisper", len(word_timings))
-                return word_timings
-            else:
-                logging.warning("Whisper returned no word timings, using fallback")
-        except ImportError:
-            logging.debug("whisper-timestamped not available, using fallback timing")
-        except Exception as exc:
-            logging.warning("Failed to extract timings with whisper: %s, using fallback", exc)
+                # Skip empty and punctuation-only tokens
+                word_timings = [
+                    WordTiming(word=word_text, start_time=word_info.get("start", 0.0), end_time=word_info.get("end", 0.0))
+                    for segment in result.get("segments", [])
+                    for word_info in segment.get("words", [])
+                    if (word_text := word_info.get("text", "").strip()) and word_text not in _PUNCTUATION_TOKENS
+                ]
+            
+                if word_timings:
+                    logging.info("Extracted %d word timings from audio using whisper", len(word_timings))
+                    return word_timings
+                else:
+                    logging.warning("Whisper returned no word timings, using fallback")
+            except ImportError:
+                logging.debug("whisper-timestamped not available, using fallback timing")
+            except Exception as exc:
+                logging.warning("Failed to extract timings with whisper: %s, using fallback", exc)
         
         # Fallback: Estimate timing based on script and audio duration with improved algorithm
         logging.info("Using improved estimated word timings based on script...")
-        try:
-            audio_clip = AudioFileClip(str(audio_path))
-            audio_duration = audio_clip.duration
-            audio_clip.close()
-        except Exception:
-            audio_duration = len(script.split()) * 0.5  # Estimate 0.5s per word
+        if audio_duration is None:
+            try:
+                audio_clip = AudioFileClip(str(audio_path))
+                audio_duration = audio_clip.duration
+                audio_clip.close()
+            except Exception:
+                audio_duration = len(script.split()) * 0.5  # Estimate 0.5s per word
         
         words = script.split()
         if not words:
@@ -4226,6 +5017,10 @@ def extract_word_timings(audio_path: Path, script: str, config: Config) -> List[
         return []
 
 
+_PHRASE_PUNCTUATION = frozenset(".!?,:;")
+_SENTENCE_END_PUNCTUATION = frozenset(".!?")
+
+
 def group_words_into_phrases(word_timings: List[WordTiming], max_chars_per_line: int = 40) -> List[Phrase]:
     """Group words into readable caption phrases.
     
@@ -4244,244 +5039,218 @@ def group_words_into_phrases(word_timings: List[WordTiming], max_chars_per_line:
     if not word_timings:
         return []
     
+    def make_phrase(words: List[WordTiming]) -> Phrase:
+        return Phrase(
+            text=" ".join(wt.word for wt in words),
+            start_time=words[0].start_time,
+            end_time=words[-1].end_time,
+            words=words
+        )
+    
     phrases = []
-    current_phrase_words = []
-    current_text = ""
-    phrase_start_time = word_timings[0].start_time if word_timings else 0.0
+    current_phrase_words: List[WordTiming] = []
+    current_length = 0  # len(" ".join(current words)), tracked instead of rebuilding the text
+    previous_end = word_timings[0].start_time
     
-    for i, word_timing in enumerate(word_timings):
+    for word_timing in word_timings:
         word = word_timing.word
-        clean_word = re.sub(r'[^\w\s]', '', word)
         
         # Check if adding this word would exceed character limit
-        test_text = current_text + (" " if current_text else "") + word
-        test_length = len(test_text)
+        test_length = current_length + (1 if current_length else 0) + len(word)
         
         # Check for natural break points
-        is_punctuation = bool(re.search(r'[.!?,:;]', word))
-        is_end_punctuation = bool(re.search(r'[.!?]', word))
+        is_punctuation = not _PHRASE_PUNCTUATION.isdisjoint(word)
+        is_end_punctuation = not _SENTENCE_END_PUNCTUATION.isdisjoint(word)
         
         # Check for pause (gap > 0.3 seconds)
-        has_pause = False
-        if i > 0:
-            gap = word_timing.start_time - word_timings[i-1].end_time
-            has_pause = gap > 0.3
+        has_pause = word_timing.start_time - previous_end > 0.3
+        previous_end = word_timing.end_time
         
         # Start new phrase if:
         # 1. Exceeds character limit AND (has punctuation OR pause)
         # 2. Has end punctuation (period, exclamation, question mark)
         # 3. Current phrase is already long enough (> 30 chars) AND has pause
-        should_break = False
+        word_count = len(current_phrase_words)
         if test_length > max_chars_per_line:
-            if is_punctuation or has_pause or len(current_phrase_words) > 8:
-                should_break = True
-        elif is_end_punctuation and len(current_phrase_words) >= 3:
-            should_break = True
-        elif has_pause and len(current_phrase_words) >= 5 and test_length > 30:
-            should_break = True
+            should_break = is_punctuation or has_pause or word_count > 8
+        elif is_end_punctuation:
+            should_break = word_count >= 3
+        else:
+            should_break = has_pause and word_count >= 5 and test_length > 30
         
         if should_break and current_phrase_words:
-            # Create phrase from current words
-            phrase_text = " ".join(wt.word for wt in current_phrase_words)
-            phrase_end_time = current_phrase_words[-1].end_time
-            
-            phrases.append(Phrase(
-                text=phrase_text,
-                start_time=phrase_start_time,
-                end_time=phrase_end_time,
-                words=current_phrase_words.copy()
-            ))
-            
+            phrases.append(make_phrase(current_phrase_words))
             # Start new phrase
             current_phrase_words = [word_timing]
-            current_text = word
-            phrase_start_time = word_timing.start_time
+            current_length = len(word)
         else:
             # Add word to current phrase
             current_phrase_words.append(word_timing)
-            current_text = test_text
+            current_length = test_length
     
     # Add final phrase
     if current_phrase_words:
-        phrase_text = " ".join(wt.word for wt in current_phrase_words)
-        phrase_end_time = current_phrase_words[-1].end_time
-        
-        phrases.append(Phrase(
-            text=phrase_text,
-            start_time=phrase_start_time,
-            end_time=phrase_end_time,
-            words=current_phrase_words.copy()
-        ))
+        phrases.append(make_phrase(current_phrase_words))
     
     return phrases
 
 
-def create_caption_clip(phrase: Phrase, video_size: Tuple[int, int], config: Config) -> Optional[ImageClip]:
-    """Create a Capcut-style caption clip with rounded background.
-    
-    Uses PIL to render text (no ImageMagick required).
+# Scratch surface for text measurement; textbbox never draws, so it is shared
+_MEASURE_DRAW = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+
+
+@functools.lru_cache(maxsize=256)
+def render_caption_image(text: str, font_path: Optional[str], font_size: int, max_text_width: int) -> np.ndarray:
+    """Render caption text on a rounded background as an RGBA array.
     
-    Args:
-        phrase: Phrase object with text and timing
-        video_size: Tuple of (width, height) for video
-        config: Config object with caption settings
-        
-    Returns:
-        CompositeVideoClip with styling, or None if creation fails
+    Cached by text and style, so phrases that recur (intros, outros) are
+    rendered once per process.
     """
-    try:
-        video_width, video_height = video_size
-        font_size = config.caption_font_size
-        fade_duration = config.caption_fade_duration
-        
-        # Get font path (prefer Coiny, fallback to system fonts)
-        font_path = get_coiny_font_path(config)
-        font = None
-        if font_path and Path(font_path).exists():
-            try:
-                font = ImageFont.truetype(font_path, font_size)
-            except Exception:
-                font = None
-        
-        # Fallback to default bold font
-        if font is None:
-            try:
-                # Try to load a bold system font
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except Exception:
-                try:
-                    font = ImageFont.truetype("C:/Windows/Fonts/arialbd.ttf", font_size)
-                except Exception:
-                    # Final fallback to default font
-                    font = ImageFont.load_default()
-                    # Scale default font to approximate size
-                    if hasattr(font, 'size'):
-                        font = ImageFont.load_default()
-        
-        # Calculate caption position based on config
-        if config.caption_position == "bottom":
-            y_position = video_height - 250  # Position above bottom overlay
-        elif config.caption_position == "top":
-            y_position = 100
-        else:  # center
-            y_position = video_height // 2
-        
-        # Render text to image using PIL
-        # First, measure text to determine size
-        max_text_width = video_width - 100  # Leave margins
-        
-        # Split text into lines if needed (word wrap)
-        words = phrase.text.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            # Get text width using a temporary image
-            test_img = Image.new('RGB', (1, 1))
-            test_draw = ImageDraw.Draw(test_img)
-            bbox = test_draw.textbbox((0, 0), test_line, font=font)
-            text_width = bbox[2] - bbox[0]
-            
-            if text_width <= max_text_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        
-        if current_line:
-            lines.append(current_line)
-        
-        if not lines:
-            lines = [phrase.text]
-        
-        # Calculate text dimensions
-        line_heights = []
-        max_line_width = 0
-        for line in lines:
-            test_img = Image.new('RGB', (1, 1))
-            test_draw = ImageDraw.Draw(test_img)
-            bbox = test_draw.textbbox((0, 0), line, font=font)
-            line_width = bbox[2] - bbox[0]
-            line_height = bbox[3] - bbox[1]
-            line_heights.append(line_height)
-            max_line_width = max(max_line_width, line_width)
-        
-        total_text_height = sum(line_heights) + (len(lines) - 1) * 10  # 10px spacing between lines
-        
-        # Add padding
-        padding_x = 40
-        padding_y = 20
-        bg_width = int(max_line_width + padding_x * 2)
-        bg_height = int(total_text_height + padding_y * 2)
-        
-        # Create background image with rounded corners
-        bg_img = create_rounded_background(
-            width=bg_width,
-            height=bg_height,
-            corner_radius=12,
-            color=(0, 0, 0),  # Black
-            opacity=0.75  # 75% opacity
-        )
-        
-        # Draw text on background
-        draw = ImageDraw.Draw(bg_img)
-        text_y = padding_y
-        for i, line in enumerate(lines):
-            # Get text bbox for this line
-            bbox = draw.textbbox((0, 0), line, font=font)
-            line_width = bbox[2] - bbox[0]
-            line_height = bbox[3] - bbox[1]
-            
-            # Center text horizontally
-            text_x = (bg_width - line_width) // 2
-            
-            # Draw text with black outline (shadow effect)
-            outline_color = (0, 0, 0)
-            for adj in [(-2, -2), (-2, 2), (2, -2), (2, 2), (-2, 0), (2, 0), (0, -2), (0, 2)]:
-                draw.text((text_x + adj[0], text_y + adj[1]), line, font=font, fill=outline_color)
-            
-            # Draw white text on top
-            draw.text((text_x, text_y), line, font=font, fill='#FFFFFF')
-            
-            text_y += line_height + 10  # Move to next line with spacing
-        
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
-            caption_img_path = tmp_file.name
-            bg_img.save(caption_img_path, "PNG")
+    # Fallback to a bold system font, then PIL's default font
+    font = load_font(font_path, font_size, fallbacks=("arial.ttf", "C:/Windows/Fonts/arialbd.ttf"))
+    
+    # Split text into lines if needed (word wrap)
+    words = text.split()
+    lines = []
+    current_line = ""
+    
+    for word in words:
+        test_line = current_line + (" " if current_line else "") + word
+        bbox = _MEASURE_DRAW.textbbox((0, 0), test_line, font=font)
+        text_width = bbox[2] - bbox[0]
         
-        # Create image clip
-        phrase_duration = phrase.end_time - phrase.start_time
-        caption_img_clip = ImageClip(caption_img_path).set_duration(phrase_duration)
-        caption_img_clip = caption_img_clip.set_start(phrase.start_time)
-        caption_img_clip = caption_img_clip.set_position(("center", y_position))
+        if text_width <= max_text_width:
+            current_line = test_line
+        else:
+            if current_line:
+                lines.append(current_line)
+            current_line = word
+    
+    if current_line:
+        lines.append(current_line)
+    
+    if not lines:
+        lines = [text]
+    
+    # Calculate text dimensions (measured once, reused when drawing)
+    bboxes = [_MEASURE_DRAW.textbbox((0, 0), line, font=font) for line in lines]
+    line_heights = [bbox[3] - bbox[1] for bbox in bboxes]
+    max_line_width = max(bbox[2] - bbox[0] for bbox in bboxes)
+    
+    total_text_height = sum(line_heights) + (len(lines) - 1) * 10  # 10px spacing between lines
+    
+    # Add padding
+    padding_x = 40
+    padding_y = 20
+    bg_width = int(max_line_width + padding_x * 2)
+    bg_height = int(total_text_height + padding_y * 2)
+    
+    # Create background image with rounded corners
+    bg_img = create_rounded_background(
+        width=bg_width,
+        height=bg_height,
+        corner_radius=12,
+        color=(0, 0, 0),  # Black
+        opacity=0.75  # 75% opacity
+    )
+    
+    # Draw text on background
+    draw = ImageDraw.Draw(bg_img)
+    text_y = padding_y
+    for line, bbox, line_height in zip(lines, bboxes, line_heights):
+        line_width = bbox[2] - bbox[0]
         
-        # Apply fade animations
-        caption_img_clip = caption_img_clip.fadein(fade_duration)
-        caption_img_clip = caption_img_clip.fadeout(fade_duration)
+        # Center text horizontally
+        text_x = (bg_width - line_width) // 2
         
-        return caption_img_clip
+        # Draw white text with a black outline (shadow effect) in a single stroked pass
+        draw.text((text_x, text_y), line, font=font, fill='#FFFFFF', stroke_width=2, stroke_fill=(0, 0, 0))
         
-    except Exception as exc:
-        logging.warning("Failed to create caption clip: %s", exc, exc_info=True)
-        return None
+        text_y += line_height + 10  # Move to next line with spacing
+    
+    pixels = np.array(bg_img)
+    pixels.flags.writeable = False  # Shared between clips through the cache
+    return pixels
 
 
+def caption_y_position(video_height: int, config: Config) -> int:
+    """Calculate caption position based on config."""
+    if config.caption_position == "bottom":
+        return video_height - 250  # Position above bottom overlay
+    if config.caption_position == "top":
+        return 100
+    return video_height // 2  # center
 
 
-def generate_captions(audio_path: Path, script: str, video_size: Tuple[int, int], config: Config) -> List[ImageClip]:
-    """Generate all caption clips for a video.
+def create_caption_track(phrases: List[Phrase], rendered: Dict[str, np.ndarray], video_size: Tuple[int, int], config: Config) -> Optional[VideoClip]:
+    """Combine all captions into a single clip showing whichever phrase is active.
+    
+    CompositeVideoClip then blends one caption layer per frame instead of
+    checking and blitting a separate ImageClip for every phrase.
     
     Args:
-        audio_path: Path to audio file
-        script: Original script text
-        video_size: Tuple of (width, height)
-        config: Config object
+        phrases: Caption phrases with timing
+        rendered: Pre-rendered RGBA caption image per phrase text
+        video_size: Tuple of (width, height) for video
+        config: Config object with caption settings
         
     Returns:
-        List of ImageClip objects for captions
+        Caption track clip with mask, or None if there is nothing to show
+    """
+    entries = []
+    for phrase in phrases:
+        pixels = rendered.get(phrase.text)
+        if pixels is None or phrase.end_time <= phrase.start_time:
+            continue
+        # RGB and alpha mask are split once per phrase, not per frame
+        entries.append((phrase.start_time, phrase.end_time, pixels[:, :, :3], pixels[:, :, 3] / 255.0))
+    if not entries:
+        return None
+    entries.sort(key=lambda entry: entry[0])
+    starts = [entry[0] for entry in entries]
+    duration = max(entry[1] for entry in entries)
+    fade_duration = config.caption_fade_duration
+    blank_rgb = np.zeros((1, 1, 3), dtype=np.uint8)
+    blank_mask = np.zeros((1, 1))
+    
+    def active_entry(t):
+        i = bisect.bisect_right(starts, t) - 1
+        if i >= 0 and t < entries[i][1]:
+            return entries[i]
+        return None
+    
+    def make_frame(t):
+        entry = active_entry(t)
+        if entry is None:
+            return blank_rgb
+        start, end, rgb, _ = entry
+        # Same fade in/out from black as the per-clip fadein/fadeout effects
+        if fade_duration > 0:
+            factor = min(1.0, (t - start) / fade_duration, (end - t) / fade_duration)
+            if factor < 1.0:
+                return rgb * max(factor, 0.0)
+        return rgb
+    
+    def make_mask(t):
+        entry = active_entry(t)
+        return blank_mask if entry is None else entry[3]
+    
+    mask = VideoClip(make_mask, ismask=True, duration=duration)
+    track = VideoClip(make_frame, duration=duration).set_mask(mask)
+    return track.set_position(("center", caption_y_position(video_size[1], config)))
+
+
+def generate_captions(audio_path: Path, script: str, video_size: Tuple[int, int], config: Config) -> List[VideoClip]:
+    """Generate the caption track for a video.
+    
+    Args:
+        audio_path: Path to audio file
+        script: Original script text
+        video_size: Tuple of (width, height)
+        config: Config object
+        
+    Returns:
+        List holding the caption track clip (empty if captions are unavailable)
     """
     if not config.enable_captions:
         return []
@@ -4502,65 +5271,108 @@ def generate_captions(audio_path: Path, script: str, video_size: Tuple[int, int]
     
     logging.info("Created %d caption phrases", len(phrases))
     
-    # Create caption clips in parallel for faster processing
-    caption_clips = []
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = {executor.submit(create_caption_clip, phrase, video_size, config): phrase for phrase in phrases}
-        for future in as_completed(futures):
-            clip = future.result()
-            if clip:
-                caption_clips.append(clip)
+    # Rasterize each distinct phrase in-process: stories already render in parallel worker
+    # processes, and render_caption_image's lru_cache serves phrases that recur
+    font_path = get_coiny_font_path(config)
+    max_text_width = video_size[0] - 100  # Leave margins
+    rendered: Dict[str, np.ndarray] = {}
+    for text in dict.fromkeys(phrase.text for phrase in phrases):
+        try:
+            rendered[text] = render_caption_image(text, font_path, config.caption_font_size, max_text_width)
+        except Exception as exc:
+            logging.warning("Failed to render caption '%s': %s", text[:30], exc)
     
-    logging.info("Generated %d caption clips", len(caption_clips))
-    return caption_clips
+    caption_track = create_caption_track(phrases, rendered, video_size, config)
+    if caption_track is None:
+        return []
+    
+    logging.info("Generated caption track with %d phrases", len(phrases))
+    return [caption_track]
+
+
+@functools.lru_cache(maxsize=8)
+def _rounded_corner_tile(corner_radius: int) -> np.ndarray:
+    """Blurred rounded-square alpha tile (0-255) used as a 9-slice source for any size."""
+    half = corner_radius + 4  # Corner plus room for the blur to settle into the straight edge
+    size = 2 * half
+    tile = Image.new('L', (size, size), 0)
+    ImageDraw.Draw(tile).rounded_rectangle([(0, 0), (size, size)], radius=corner_radius, fill=255)
+    tile = tile.filter(ImageFilter.GaussianBlur(radius=1))
+    return np.asarray(tile, dtype=np.float32)
+
+
+def _nine_slice_indices(length: int, half: int) -> np.ndarray:
+    """Map output coordinates onto tile coordinates, repeating the tile's middle line."""
+    return np.concatenate((
+        np.arange(half),
+        np.full(length - 2 * half, half),
+        np.arange(half, 2 * half),
+    ))
 
 
 def create_rounded_background(width: int, height: int, corner_radius: int, color: tuple, opacity: float) -> Image.Image:
     """Create a rounded rectangle background with gradient effect."""
-    # Create image with alpha channel
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    # Draw rounded rectangle
-    draw.rounded_rectangle(
-        [(0, 0), (width, height)],
-        radius=corner_radius,
-        fill=(*color, int(255 * opacity))
-    )
+    half = corner_radius + 4
+    if width < 2 * half or height < 2 * half:
+        # Too small to 9-slice: draw it directly
+        img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        ImageDraw.Draw(img).rounded_rectangle(
+            [(0, 0), (width, height)],
+            radius=corner_radius,
+            fill=(*color, int(255 * opacity))
+        )
+        # Apply slight blur for softer edges
+        return img.filter(ImageFilter.GaussianBlur(radius=1))
     
-    # Apply slight blur for softer edges
-    img = img.filter(ImageFilter.GaussianBlur(radius=1))
-    return img
+    # Stretch the cached corner tile to (width, height) and fill the color planes
+    tile = _rounded_corner_tile(corner_radius)
+    mask = tile[np.ix_(_nine_slice_indices(height, half), _nine_slice_indices(width, half))]
+    pixels = np.empty((height, width, 4), dtype=np.uint8)
+    pixels[..., :3] = color
+    pixels[..., 3] = mask * (int(255 * opacity) / 255.0)
+    return Image.fromarray(pixels, 'RGBA')
 
 
-def create_gradient_background(width: int, height: int, start_color: tuple, end_color: tuple, opacity: float) -> Image.Image:
-    """Create a gradient background from start_color to end_color."""
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+def vertical_gradient_array(width: int, height: int, start_color: tuple, end_color: tuple) -> np.ndarray:
+    """Build a top-to-bottom linear gradient as an (height, width, channels) uint8 array.
     
-    for y in range(height):
-        ratio = y / height if height > 0 else 0
-        r = int(start_color[0] * (1 - ratio) + end_color[0] * ratio)
-        g = int(start_color[1] * (1 - ratio) + end_color[1] * ratio)
-        b = int(start_color[2] * (1 - ratio) + end_color[2] * ratio)
-        draw.line([(0, y), (width, y)], fill=(r, g, b, int(255 * opacity)))
-    
-    return img
+    Colors may be RGB or RGBA; every row is interpolated once and broadcast across the width.
+    """
+    ratio = (np.arange(height, dtype=np.float32) / max(height, 1))[:, None]
+    start = np.array(start_color, dtype=np.float32)
+    end = np.array(end_color, dtype=np.float32)
+    rows = (start * (1 - ratio) + end * ratio).astype(np.uint8)
+    return np.broadcast_to(rows[:, None, :], (height, width, len(start_color))).copy()
 
 
-def ease_out_cubic(progress: float) -> float:
-    """Ease out cubic easing function for smooth animations."""
-    return 1 - (1 - progress) ** 3
+def create_gradient_background(width: int, height: int, start_color: tuple, end_color: tuple, opacity: float) -> Image.Image:
+    """Create a gradient background from start_color to end_color."""
+    alpha = int(255 * opacity)
+    pixels = vertical_gradient_array(width, height, (*start_color[:3], alpha), (*end_color[:3], alpha))
+    return Image.fromarray(pixels, 'RGBA')
 
 
-def ease_in_out(progress: float) -> float:
-    """Ease in-out easing function for smooth animations."""
-    return progress * progress * (3 - 2 * progress)
+@functools.lru_cache(maxsize=16)
+def load_font(font_path: Optional[str], font_size: int, fallbacks: Tuple[str, ...] = ()) -> ImageFont.ImageFont:
+    """Load a TrueType font once per (path, size), trying fallbacks before PIL's default font."""
+    for candidate in (font_path, *fallbacks):
+        if not candidate:
+            continue
+        try:
+            return ImageFont.truetype(candidate, font_size)
+        except (OSError, ValueError):
+            continue
+    return ImageFont.load_default()
 
 
 def get_coiny_font_path(config: Config) -> Optional[str]:
     """Download and return path to Coiny font from Google Fonts.
     Returns the font file path, or None if download fails."""
+    return _resolve_coiny_font_path()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_coiny_font_path() -> Optional[str]:
     fonts_dir = Path(__file__).parent / "fonts"
     fonts_dir.mkdir(exist_ok=True)
     
@@ -4576,12 +5388,17 @@ def get_coiny_font_path(config: Config) -> Optional[str]:
         # Direct download link for Coiny Regular TTF
         font_url = "https://github.com/google/fonts/raw/main/ofl/coiny/Coiny-Regular.ttf"
         
-        response = requests.get(font_url, timeout=30)
-        response.raise_for_status()
-        
-        # Save font file
-        with open(font_path, "wb") as f:
-            f.write(response.content)
+        # Stream to a .part file and rename atomically so a partial download never looks cached
+        tmp_path = font_path.with_name(f"{font_path.name}.{os.getpid()}.part")
+        try:
+            with _HTTP_SESSION.get(font_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(tmp_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f)
+            os.replace(tmp_path, font_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
         
         logging.info("Coiny font downloaded successfully to %s", font_path)
         return str(font_path)
@@ -4591,64 +5408,52 @@ def get_coiny_font_path(config: Config) -> Optional[str]:
         return None
 
 
-def commit_and_push_video(video_path: Path, article_title: str) -> bool:
-    """Commit and push video file to git repository.
+@functools.lru_cache(maxsize=None)
+def _find_repo_root(start: Path) -> Optional[Path]:
+    """Locate the git repository root containing start (remembered per directory).
+    
+    Under GitHub Actions the checkout in GITHUB_WORKSPACE is used without running git.
+    """
+    workspace = os.environ.get("GITHUB_WORKSPACE")
+    if workspace:
+        workspace_path = Path(workspace).resolve()
+        if (workspace_path == start or workspace_path in start.parents) and (workspace_path / ".git").exists():
+            return workspace_path
+    
+    result = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"],
+        capture_output=True,
+        text=True,
+        cwd=start
+    )
+    if result.returncode != 0:
+        return None
+    return Path(result.stdout.strip())
+
+
+def stage_video(video_path: Path) -> Optional[Tuple[Path, Path]]:
+    """Stage a video file with git add, ready for the end-of-run batch commit.
     
     Returns:
-        True if successful, False otherwise
+        (repo_root, path relative to repo_root) if staged, None otherwise
     """
     if not video_path.exists():
         logging.warning("Video file does not exist, cannot commit: %s", video_path)
-        return False
+        return None
     
     try:
-        # Start from video path and work up to find git repository
-        search_path = video_path.resolve().parent
-        repo_root = None
-        
-        # Try to find git repository root by checking parent directories
-        for _ in range(10):  # Limit search to 10 levels up
-            git_dir = search_path / ".git"
-            if git_dir.exists():
-                repo_root = search_path
-                break
-            if search_path == search_path.parent:  # Reached filesystem root
-                break
-            search_path = search_path.parent
-        
+        repo_root = _find_repo_root(video_path.resolve().parent)
         if not repo_root:
-            # Fallback: try git rev-parse from current working directory
-            repo_root_result = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True,
-                text=True,
-                cwd=Path.cwd()
-            )
-            if repo_root_result.returncode == 0:
-                repo_root = Path(repo_root_result.stdout.strip())
-            else:
-                logging.debug("Not in a git repository, skipping commit/push")
-                return False
+            logging.debug("Not in a git repository, skipping commit/push")
+            return None
         
         # Get relative path from repository root
         try:
             relative_video_path = video_path.resolve().relative_to(repo_root.resolve())
         except ValueError:
-            # Video is outside repository, use absolute path (shouldn't happen)
+            # Video is outside repository (shouldn't happen)
             logging.warning("Video path is outside git repository: %s", video_path)
-            return False
-        
-        # Configure git user if not already configured (for GitHub Actions)
-        subprocess.run(
-            ["git", "config", "user.name", "TechNewsDaily Bot"],
-            capture_output=True,
-            cwd=repo_root
-        )
-        subprocess.run(
-            ["git", "config", "user.email", "technewsdaily@users.noreply.github.com"],
-            capture_output=True,
-            cwd=repo_root
-        )
+            return None
         
         # Add video file
         subprocess.run(
@@ -4657,20 +5462,54 @@ def commit_and_push_video(video_path: Path, article_title: str) -> bool:
             capture_output=True,
             cwd=repo_root
         )
+        return repo_root, relative_video_path
+    
+    except subprocess.CalledProcessError as exc:
+        logging.warning("Git operation failed: %s", exc)
+        return None
+    except Exception as exc:
+        logging.warning("Failed to stage video in git: %s", exc)
+        return None
+
+
+def commit_and_push_videos(repo_root: Path, staged_videos: List[Tuple[Path, str]]) -> bool:
+    """Commit all staged videos in one commit and push once.
+    
+    Args:
+        repo_root: Repository the videos were staged in
+        staged_videos: (path relative to repo_root, article title) per video
         
+    Returns:
+        True if successful, False otherwise
+    """
+    if not staged_videos:
+        return True
+    
+    try:
         # Commit with descriptive message
-        commit_message = f"Add video: {article_title[:60]}"
+        if len(staged_videos) == 1:
+            commit_message = f"Add video: {staged_videos[0][1][:60]}"
+        else:
+            titles = "\n".join(f"- {title[:60]}" for _, title in staged_videos)
+            commit_message = f"Add {len(staged_videos)} videos\n\n{titles}"
+        # Pass the bot identity per command (for GitHub Actions) unless the environment provides one
+        identity_args = []
+        if not (os.getenv("GIT_AUTHOR_NAME") and os.getenv("GIT_COMMITTER_NAME")):
+            identity_args = ["-c", "user.name=TechNewsDaily Bot",
+                             "-c", "user.email=technewsdaily@users.noreply.github.com"]
+        # Commit only the videos, leaving anything else in the index alone
         commit_result = subprocess.run(
-            ["git", "commit", "-m", commit_message],
+            ["git", *identity_args, "commit", "-m", commit_message, "--",
+             *(str(path) for path, _ in staged_videos)],
             capture_output=True,
             text=True,
             cwd=repo_root
         )
         
         if commit_result.returncode == 0:
-            logging.info("Committed video to git: %s", relative_video_path)
+            logging.info("Committed %d video(s) to git", len(staged_videos))
         elif "nothing to commit" in commit_result.stdout.lower() or "nothing to commit" in commit_result.stderr.lower():
-            logging.debug("Video already committed, nothing to commit")
+            logging.debug("Videos already committed, nothing to commit")
             return True
         else:
             logging.warning("Git commit failed: %s", commit_result.stderr)
@@ -4685,31 +5524,251 @@ def commit_and_push_video(video_path: Path, article_title: str) -> bool:
         )
         
         if push_result.returncode == 0:
-            logging.info("Pushed video to git repository")
+            logging.info("Pushed videos to git repository")
             return True
         else:
             logging.warning("Git push failed: %s", push_result.stderr)
             return False
             
-    except subprocess.CalledProcessError as exc:
-        logging.warning("Git operation failed: %s", exc)
-        return False
     except Exception as exc:
-        logging.warning("Failed to commit/push video to git: %s", exc)
+        logging.warning("Failed to commit/push videos to git: %s", exc)
         return False
 
 
+def probe_media_duration(media_path) -> Optional[float]:
+    """Read a media file's duration with ffprobe, without opening a MoviePy clip.
+    
+    Returns:
+        Duration in seconds, or None if it could not be determined
+    """
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+             "-of", "default=nw=1:nk=1", str(media_path)],
+            capture_output=True,
+            text=True,
+            timeout=15,
+        )
+        if result.returncode == 0:
+            return float(result.stdout.strip())
+    except (OSError, ValueError, subprocess.TimeoutExpired) as exc:
+        logging.debug("ffprobe failed for %s: %s", media_path, exc)
+    return None
+
+
+# Rendered videos always land here (for GitHub Actions); created once at import
+ARTIFACTS_DIR = Path("artifacts")
+ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
+
+VIDEO_FPS = 20  # Reduced from 24 - barely noticeable, faster encoding
+
+# Bitrate-targeted rate control: still high quality for 1080p, well under TikTok's 50 MB limit
+_ABR_PARAMS = ["-b:v", "3500k", "-maxrate", "5000k", "-bufsize", "7000k"]
+
+# Hardware H.264 encoders in order of preference, with their ffmpeg options
+HARDWARE_ENCODERS: List[Tuple[str, str, List[str]]] = [
+    ("h264_nvenc", "p4", ["-tune", "hq", "-rc", "vbr", "-cq", "23", *_ABR_PARAMS]),
+    ("h264_videotoolbox", "medium", _ABR_PARAMS),
+    ("h264_qsv", "veryfast", _ABR_PARAMS),
+]
+# libx264 uses capped CRF instead of ABR: constant quality with no global bitrate target to chase
+SOFTWARE_ENCODER: Tuple[str, str, Tuple[str, ...]] = (
+    "libx264", "veryfast",
+    ("-tune", "fastdecode", "-x264-params", "rc-lookahead=10", "-crf", "23", "-maxrate", "4M", "-bufsize", "6M"),
+)
+# Muxer/pixel format options applied whichever encoder is used (streamable, widely playable MP4)
+OUTPUT_FFMPEG_PARAMS = ("-movflags", "+faststart", "-pix_fmt", "yuv420p")
+
+
+@functools.lru_cache(maxsize=1)
+def detect_video_encoder() -> Tuple[str, str, Tuple[str, ...]]:
+    """Pick the fastest working H.264 encoder for write_videofile.
+    
+    An encoder listed by ``ffmpeg -encoders`` can still fail without a usable GPU,
+    so each candidate is verified with a tiny test encode.
+    
+    Returns:
+        (codec, preset, extra ffmpeg params)
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=15,
+        )
+        available = result.stdout if result.returncode == 0 else ""
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        logging.debug("Could not list ffmpeg encoders: %s", exc)
+        available = ""
+    
+    for codec, preset, params in HARDWARE_ENCODERS:
+        if codec not in available:
+            continue
+        try:
+            probe = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+                 "-c:v", codec, "-f", "null", "-"],
+                capture_output=True, text=True, timeout=30,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if probe.returncode == 0:
+            logging.info("Using hardware video encoder: %s", codec)
+            return codec, preset, tuple(params)
+    
+    return SOFTWARE_ENCODER
+
+
+NARRATION_AAC_PARAMS = ("-c:a", "aac", "-b:a", "128k", "-ar", "44100")
+
+
+def encode_narration_aac(audio_path: Path, duration: float) -> Optional[Path]:
+    """Encode narration to AAC once, next to the source, so video encodes can stream-copy it.
+    
+    The encoded file is reused by every encode attempt of the video (e.g. the
+    hardware-encoder fallback).
+    
+    Returns:
+        Path to the .m4a file, or None if encoding failed
+    """
+    aac_path = audio_path.with_suffix(".m4a")
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-i", str(audio_path),
+             "-t", f"{duration:.3f}", "-vn", *NARRATION_AAC_PARAMS, str(aac_path)],
+            capture_output=True, text=True, check=False,
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        logging.warning("Failed to pre-encode narration audio: %s", exc)
+        return None
+    if result.returncode != 0:
+        logging.warning("FFmpeg AAC encode failed: %s", result.stderr)
+        aac_path.unlink(missing_ok=True)
+        return None
+    return aac_path
+
+
+def encode_video_with_ffmpeg(clip, output_path: Path, audio_path: Optional[Path], codec: str, preset: str, encoder_params: Tuple[str, ...]) -> None:
+    """Pipe a clip's frames straight into an ffmpeg encoder.
+    
+    With OpenCV installed, frames are converted to planar YUV 4:2:0 before writing,
+    halving the bytes pushed through the pipe (1.5 vs 3 bytes/pixel) and sparing the
+    encoder its own RGB->YUV conversion; otherwise raw rgb24 is sent.
+    
+    The narration file is muxed in as-is (stream-copied when already AAC), so MoviePy
+    never re-renders the audio to a temporary file. Audio is cut to the clip duration with -t (not -shortest,
+    which would truncate the video when the narration is shorter).
+    
+    Raises:
+        RuntimeError: If ffmpeg exits with an error
+    """
+    width, height = clip.size
+    send_yuv = cv2 is not None and width % 2 == 0 and height % 2 == 0
+    cmd = [
+        "ffmpeg", "-hide_banner", "-nostats", "-loglevel", "error", "-y",
+        "-f", "rawvideo", "-pix_fmt", "yuv420p" if send_yuv else "rgb24",
+        "-s", f"{width}x{height}", "-r", str(VIDEO_FPS),
+        "-i", "-",
+    ]
+    if audio_path:
+        cmd += ["-i", str(audio_path)]
+    cmd += [
+        "-c:v", codec, "-preset", preset, *encoder_params,
+        "-threads", str(_CPU_THREADS),
+    ]
+    if audio_path:
+        if audio_path.suffix in (".aac", ".m4a"):
+            cmd += ["-c:a", "copy"]
+        else:
+            cmd += list(NARRATION_AAC_PARAMS)
+    cmd += [*OUTPUT_FFMPEG_PARAMS, "-t", f"{clip.duration:.3f}", str(output_path)]
+    
+    # stderr goes to a file, not a pipe: nothing reads a pipe until every frame is written,
+    # so a chatty ffmpeg would block on a full stderr pipe and deadlock the frame writes
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=stderr_file)
+        try:
+            try:
+                for frame in clip.iter_frames(fps=VIDEO_FPS, dtype="uint8"):
+                    # Write the frame buffer itself; tobytes() would copy every frame once more
+                    frame = np.ascontiguousarray(frame[:, :, :3])
+                    if send_yuv:
+                        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2YUV_I420)  # BT.601 limited range, like swscale
+                    proc.stdin.write(frame.data)
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass  # ffmpeg exited early; its error is reported below
+            proc.wait()
+        finally:
+            if proc.poll() is None:
+                # Frame rendering failed: don't leave ffmpeg waiting on stdin
+                proc.kill()
+                proc.wait()
+        if proc.returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", errors="replace")
+            raise RuntimeError(f"ffmpeg {codec} encode failed: {stderr.strip()[-500:]}")
+
+
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+# ASCII fast path equivalent to _UNSAFE_FILENAME_RE: drop everything but word chars, whitespace and '-'
+_SAFE_TITLE_TABLE = str.maketrans({
+    c: None for c in map(chr, range(128)) if not (c.isalnum() or c.isspace() or c in "-_")
+})
+_SPACE_TO_UNDERSCORE = str.maketrans({" ": "_"})
+
+
+def safe_filename_title(title: str, max_length: int) -> str:
+    """Strip a title down to filename-safe characters, with spaces turned into underscores."""
+    if title.isascii():
+        cleaned = title.translate(_SAFE_TITLE_TABLE)
+    else:
+        cleaned = _UNSAFE_FILENAME_RE.sub('', title)
+    return cleaned[:max_length].strip().translate(_SPACE_TO_UNDERSCORE)
+
+
+def _safe_close(clip) -> None:
+    """Close a MoviePy clip, ignoring errors from already-closed readers."""
+    with contextlib.suppress(Exception):
+        clip.close()
+
+
+def _wait_for_file_release(path: Path, max_wait: float = 0.1) -> None:
+    """Poll until path can be opened for writing (Windows keeps it locked while handles are open).
+    
+    Backs off exponentially from 1 ms and gives up after max_wait seconds.
+    """
+    delay = 0.001
+    waited = 0.0
+    while True:
+        try:
+            with open(path, "ab"):
+                return
+        except FileNotFoundError:
+            return
+        except OSError:
+            if waited >= max_wait:
+                return
+            step = min(delay, max_wait - waited)
+            time.sleep(step)
+            waited += step
+            delay *= 2
+
+
 def assemble_video(article: ArticleCandidate, script: str, config: Config, video_index: int = 0) -> Path:
     # Generate unique filename based on story title and index
     # Sanitize title for filename
-    safe_title = re.sub(r'[^\w\s-]', '', article.title)[:50].strip().replace(' ', '_')
+    safe_title = safe_filename_title(article.title, 50)
     if not safe_title:
         safe_title = f"story_{video_index + 1}"
     filename = f"tech_news_{video_index + 1}_{safe_title}.mp4"
-    output_path = config.output_dir / filename
+    # Encode straight into the artifacts folder (for GitHub Actions), so the video is
+    # available there even if OUTPUT_DIR is set elsewhere, without a post-render copy
+    output_path = ARTIFACTS_DIR / filename
     video_size = (1080, 1920)
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
+    # Clips register their close() on clip_stack when created; it unwinds (even on error)
+    # before the temp directory is removed, releasing file handles (critical on Windows)
+    with tempfile.TemporaryDirectory() as tmp_dir, contextlib.ExitStack() as clip_stack:
         tmp_path = Path(tmp_dir)
         
         # Generate audio first to determine duration
@@ -4717,10 +5776,24 @@ def assemble_video(article: ArticleCandidate, script: str, config: Config, video
         audio_clip = None
         audio_duration = 40.0  # Default duration
         
+        # Stock media fetching and caption transcription are network/IO bound and only
+        # captions depend on the narration, so overlap them with TTS and clip building.
+        # Results are awaited below; on an error path the executor is shut down (pending
+        # tasks cancelled, running ones joined) before the temp directory they write to is removed.
+        media_executor = ThreadPoolExecutor(max_workers=2)
+        clip_stack.callback(media_executor.shutdown, wait=True, cancel_futures=True)
+        # Prepare stock media (multiple videos and images) - fetch more to ensure we have enough
+        stock_media_future = media_executor.submit(prepare_stock_media, article, config, tmp_path, 10)
+        
         generated_audio = generate_audio(script, audio_path, config)
+        caption_future = None
+        if config.enable_captions and generated_audio and generated_audio.exists():
+            caption_future = media_executor.submit(generate_captions, audio_path, script, video_size, config)
+        
         if generated_audio and generated_audio.exists():
             try:
                 audio_clip = AudioFileClip(str(audio_path))
+                clip_stack.callback(_safe_close, audio_clip)
                 audio_duration = audio_clip.duration
                 if audio_duration < 15.0:
                     logging.warning("Audio too short (%.2fs), using minimum duration", audio_duration)
@@ -4732,18 +5805,17 @@ def assemble_video(article: ArticleCandidate, script: str, config: Config, video
             except Exception as exc:
                 logging.warning("Failed to load audio: %s, using default duration", exc)
                 audio_clip = None
-                if audio_clip:
-                    audio_clip.close()
-                    audio_clip = None
 
         duration_seconds = max(15.0, min(60.0, audio_duration))  # Clamp between 15-60 seconds
 
-        # Prepare stock media (multiple videos and images) - fetch more to ensure we have enough
-        stock_video_paths, stock_image_paths = prepare_stock_media(article, config, tmp_path, count=10)
+        stock_video_paths, stock_image_paths = stock_media_future.result()
         
         # Create video clips
         video_clips = []
-        clips_to_close = []  # Track clips that need explicit closing
+        # Source clips that own a file reader, each registered exactly once when opened.
+        # Segments, loops and resized copies share their source's reader, so only these are closed.
+        # A nested stack so a failed stock-video pass can release its readers early.
+        source_clips = clip_stack.enter_context(contextlib.ExitStack())
         
         # Cache video durations to avoid reopening files
         video_durations = {}
@@ -4751,32 +5823,24 @@ def assemble_video(article: ArticleCandidate, script: str, config: Config, video
         # Helper function to get video duration (cached)
         def get_video_duration(video_path):
             if video_path not in video_durations:
-                try:
-                    temp_video = VideoFileClip(video_path)
-                    video_durations[video_path] = temp_video.duration
-                    temp_video.close()
-                    # Explicitly close reader to free resources
-                    if hasattr(temp_video, 'reader') and temp_video.reader:
-                        try:
-                            temp_video.reader.close()
-                        except:
-                            pass
-                except:
-                    video_durations[video_path] = 10.0  # Default fallback
+                duration = probe_media_duration(video_path)
+                video_durations[video_path] = duration if duration else 10.0  # Default fallback
             return video_durations[video_path]
         
         # Helper function to create video clip from a video file
         def create_video_clip(video_path, start_time, duration, fade_in=False, fade_out=False):
             """Create a video clip segment with optional fades."""
             stock_video = VideoFileClip(video_path)
-            clips_to_close.append(stock_video)
+            source_clips.callback(_safe_close, stock_video)
             
-            # Resize video to 1080x1920
-            stock_video = stock_video.resize(height=1920)
-            if stock_video.w > 1080:
-                stock_video = stock_video.crop(x_center=stock_video.w/2, width=1080)
-            elif stock_video.w < 1080:
-                stock_video = stock_video.resize(width=1080)
+            # Stock videos are pre-scaled to 1080x1920 by normalize_stock_video;
+            # only fall back to per-frame resizing if that step failed
+            if tuple(stock_video.size) != (1080, 1920):
+                stock_video = stock_video.resize(height=1920)
+                if stock_video.w > 1080:
+                    stock_video = stock_video.crop(x_center=stock_video.w/2, width=1080)
+                elif stock_video.w < 1080:
+                    stock_video = stock_video.resize(width=1080)
             
             # Get segment from video (loop if needed)
             video_duration = stock_video.duration
@@ -4784,23 +5848,12 @@ def assemble_video(article: ArticleCandidate, script: str, config: Config, video
             
             if start_time >= video_duration:
                 start_time = start_time % video_duration
-            end_time = min(start_time + duration, video_duration)
             
-            video_segment = stock_video.subclip(start_time, end_time)
-            
-            # If we need more duration, loop the video
-            if video_segment.duration < duration:
-                remaining = duration - video_segment.duration
-                loop_segments = [video_segment]
-                loop_start = 0
-                while remaining > 0:
-                    loop_duration = min(remaining, video_duration)
-                    loop_segment = stock_video.subclip(loop_start, loop_start + loop_duration)
-                    loop_segments.append(loop_segment)
-                    remaining -= loop_duration
-                    loop_start = (loop_start + loop_duration) % video_duration
-                if len(loop_segments) > 1:
-                    video_segment = concatenate_videoclips(loop_segments)
+            # If we need more duration, loop the video at the reader level (t % duration)
+            # instead of concatenating re-decoded subclips
+            if start_time + duration > video_duration:
+                stock_video = stock_video.fx(vfx.loop, duration=start_time + duration)
+            video_segment = stock_video.subclip(start_time, start_time + duration)
             
             # Add fades
             if fade_in:
@@ -4814,7 +5867,10 @@ def assemble_video(article: ArticleCandidate, script: str, config: Config, video
         def create_image_clip(image_path, duration, zoom_start=1.1, zoom_end=1.0, fade_in=False, fade_out=False):
             """Create an image clip with Ken Burns effect."""
             img_clip = ImageClip(str(image_path)).set_duration(duration)
-            img_clip = img_clip.resize(lambda t: zoom_start + (zoom_end - zoom_start) * (t / duration))
+            # Zoom factor per output frame, computed once instead of per get_frame call
+            zoom_scales = np.linspace(zoom_start, zoom_end, int(duration * VIDEO_FPS) + 1).tolist()
+            last_frame = len(zoom_scales) - 1
+            img_clip = img_clip.resize(lambda t: zoom_scales[min(last_frame, int(t * VIDEO_FPS))])
             img_clip = img_clip.set_position(("center", "center"))
             if fade_in:
                 img_clip = img_clip.fadein(0.5)
@@ -4931,21 +5987,12 @@ def assemble_video(article: ArticleCandidate, script: str, config: Config, video
                 else:
                     logging.warning("No stock videos could be used, falling back to images")
                     # Close any clips that were created before the error
-                    for clip in clips_to_close:
-                        try:
-                            clip.close()
-                        except:
-                            pass
-                    clips_to_close.clear()
+                    source_clips.close()
             except Exception as exc:
                 logging.warning("Failed to process stock videos: %s, falling back to images", exc)
-                # Close any clips that were created before the error
-                for clip in clips_to_close:
-                    try:
-                        clip.close()
-                    except:
-                        pass
-                clips_to_close.clear()
+                # Close any clips that were created before the error; their segments are unusable now
+                source_clips.close()
+                video_clips.clear()
         
         # Use multiple images if no videos available or videos didn't work
         if not video_clips and stock_image_paths:
@@ -4998,7 +6045,10 @@ def assemble_video(article: ArticleCandidate, script: str, config: Config, video
         
         # Concatenate all video clips
         if len(video_clips) > 1:
-            base_video = concatenate_videoclips(video_clips, method="compose")
+            # "chain" is a plain concat; Ken Burns image clips are larger than the frame
+            # while zooming and still need "compose" to center-crop them
+            same_size = all(tuple(clip.size) == video_size for clip in video_clips)
+            base_video = concatenate_videoclips(video_clips, method="chain" if same_size else "compose")
             # Note: concatenate_videoclips creates a new clip, original clips still need closing
         else:
             base_video = video_clips[0]
@@ -5012,18 +6062,8 @@ def assemble_video(article: ArticleCandidate, script: str, config: Config, video
             
             if remaining > 0.1:  # Only extend if meaningful duration needed
                 try:
-                    # Simple approach: loop the last second of the video to fill remaining time
-                    last_segment_duration = min(remaining, max(1.0, base_video.duration))
-                    last_segment = base_video.subclip(max(0, base_video.duration - last_segment_duration), base_video.duration)
-                    
-                    # Loop this segment to fill remaining time
-                    num_loops = int(remaining / last_segment_duration) + 1
-                    looped_segments = [last_segment] * num_loops
-                    extension_clip = concatenate_videoclips(looped_segments).subclip(0, remaining)
-                    
-                    # Concatenate with original
-                    base_video = concatenate_videoclips([base_video, extension_clip]).set_duration(duration_seconds)
-                    logging.info("Extended video to %.2fs by looping last segment", duration_seconds)
+                    base_video = base_video.fx(vfx.loop, duration=duration_seconds)
+                    logging.info("Extended video to %.2fs by looping", duration_seconds)
                 except Exception as exc:
                     logging.warning("Failed to extend video by looping, setting duration directly: %s", exc)
                     # Fallback: just set duration (will freeze on last frame)
@@ -5036,23 +6076,28 @@ def assemble_video(article: ArticleCandidate, script: str, config: Config, video
 
         # Create subtle gradient overlay at bottom
         # This helps with readability on bright backgrounds
-        overlay = ColorClip(
-            size=(video_size[0], 200), 
-            color=(0, 0, 0)
-        ).set_opacity(0.2).set_position(("center", video_size[1] - 200)).set_duration(duration_seconds)
+        # Static RGBA image: the 20% alpha is baked into the mask once instead of set_opacity per frame
+        overlay_pixels = np.zeros((200, video_size[0], 4), dtype=np.uint8)
+        overlay_pixels[..., 3] = int(0.2 * 255)
+        overlay = ImageClip(overlay_pixels, transparent=True).set_position(("center", video_size[1] - 200)).set_duration(duration_seconds)
 
         # Generate captions if enabled
         caption_clips = []
-        if config.enable_captions and generated_audio and generated_audio.exists():
+        if caption_future is not None:
             try:
-                caption_clips = generate_captions(audio_path, script, video_size, config)
+                caption_clips = caption_future.result()
             except Exception as exc:
                 logging.warning("Failed to generate captions: %s", exc)
                 caption_clips = []
 
+        # The compositor and its mask/fade layers may ask the background for the same
+        # timestamp more than once per output frame; keep the last frame around
+        base_video.memoize = True
+        
         # Composite base video, overlay, and captions
         clips = [base_video, overlay] + caption_clips
         composite = CompositeVideoClip(clips, size=video_size)
+        clip_stack.callback(_safe_close, composite)
         composite = composite.set_duration(duration_seconds)
         
         # Add audio if available
@@ -5067,23 +6112,34 @@ def assemble_video(article: ArticleCandidate, script: str, config: Config, video
 
         # Write video file with error handling
         try:
-            composite.write_videofile(
-                str(output_path),
-                fps=20,  # Reduced from 24 - barely noticeable, faster encoding
-                codec="libx264",
-                audio_codec="aac" if audio_clip else None,
-                bitrate="3500k",  # Reduced from 5000k - still high quality for 1080p, faster encoding
-                verbose=False,
-                logger=None,
-                preset="fast",  # Changed from "medium" - faster encoding with minimal quality loss
-                threads=4,  # Use multiple threads for faster encoding
-            )
+            codec, preset, encoder_params = detect_video_encoder()
+            muxed_audio_path = None
+            if audio_clip:
+                muxed_audio_path = encode_narration_aac(audio_path, duration_seconds) or audio_path
+            if codec == SOFTWARE_ENCODER[0]:
+                preset = config.x264_preset
+            
+            def write_output(codec, preset, encoder_params):
+                encode_video_with_ffmpeg(
+                    composite, output_path, muxed_audio_path,
+                    codec, preset, encoder_params,
+                )
+            
+            try:
+                write_output(codec, preset, encoder_params)
+            except Exception as exc:
+                if codec == SOFTWARE_ENCODER[0]:
+                    raise
+                logging.warning("Hardware encoder %s failed, falling back to libx264: %s", codec, exc)
+                write_output(SOFTWARE_ENCODER[0], config.x264_preset, SOFTWARE_ENCODER[2])
             
             # Verify output file
-            if not output_path.exists():
-                raise FileNotFoundError("Video file was not created")
+            try:
+                output_stat = os.stat(output_path)
+            except FileNotFoundError:
+                raise FileNotFoundError("Video file was not created") from None
             
-            file_size_mb = output_path.stat().st_size / (1024 * 1024)
+            file_size_mb = output_stat.st_size / (1024 * 1024)
             if file_size_mb > 50:
                 logging.warning("Video file size (%.2f MB) exceeds TikTok limit (50 MB)", file_size_mb)
             else:
@@ -5092,71 +6148,178 @@ def assemble_video(article: ArticleCandidate, script: str, config: Config, video
         except Exception as exc:
             logging.error("Failed to write video file: %s", exc)
             raise
-        
-        finally:
-            # Cleanup: Close all clips to release file handles (critical on Windows)
-            if audio_clip:
-                try:
-                    audio_clip.close()
-                except:
-                    pass
-            
-            if composite:
-                try:
-                    composite.close()
-                except:
-                    pass
-            
-            if base_video:
-                try:
-                    base_video.close()
-                except:
-                    pass
-            
-            # Close all tracked clips
-            for clip in clips_to_close:
-                try:
-                    clip.close()
-                except:
-                    pass
-            
-            # Close any remaining clips in video_clips
-            for clip in video_clips:
-                if hasattr(clip, 'close'):
-                    try:
-                        clip.close()
-                    except:
-                        pass
-            
-            # Small delay to ensure file handles are released (Windows-specific)
-            time.sleep(0.1)
+
+    # Ensure file handles are released (Windows-specific)
+    if sys.platform == "win32":
+        _wait_for_file_release(output_path)
 
     logging.info("Video assembled at %s", output_path)
     
-    # Ensure video is also saved to artifacts folder (for GitHub Actions)
-    # This ensures videos are available in the artifacts folder even if OUTPUT_DIR is set elsewhere
-    artifacts_dir = Path("artifacts")
-    artifacts_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Copy video to artifacts folder if it's not already there
-    artifacts_video_path = artifacts_dir / output_path.name
-    if output_path.resolve() != artifacts_video_path.resolve() and output_path.exists():
+    # Expose the video in OUTPUT_DIR too when it is not the artifacts folder
+    output_dir_path = config.output_dir / filename
+    output_resolved = output_path.resolve()
+    if output_dir_path.resolve() != output_resolved:
         try:
-            shutil.copy2(output_path, artifacts_video_path)
-            logging.info("Video also saved to artifacts folder: %s", artifacts_video_path)
-            output_path = artifacts_video_path  # Use artifacts path for git operations
-        except Exception as exc:
-            logging.warning("Failed to copy video to artifacts folder: %s", exc)
-    elif output_path.resolve() == artifacts_video_path.resolve():
-        logging.debug("Video already in artifacts folder: %s", output_path)
+            if output_dir_path.is_symlink() or output_dir_path.exists():
+                output_dir_path.unlink()
+            os.symlink(output_resolved, output_dir_path)
+        except OSError:
+            # Symlinks may be unavailable (e.g. unprivileged Windows): hardlink or copy instead
+            try:
+                link_or_copy(output_path, output_dir_path)
+            except Exception as exc:
+                logging.warning("Failed to link video into output folder: %s", exc)
+    
+    return output_path
+
+
+# Single writer thread for the covered stories log, keeping its appends ordered
+_PERSIST_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="persist")
+
+
+def story_worker_count(story_count: int) -> int:
+    """Number of stories to render at once.
     
-    # Commit and push video to git repository
+    NVENC has a single encode engine, so hardware-encoded renders run one at a time.
+    """
+    if detect_video_encoder()[0] == "h264_nvenc":
+        return 1
+    return max(1, min(story_count, (os.cpu_count() or 2) // 2))
+
+
+def _init_story_worker(worker_count: int = 1, media_claims=None, media_claims_lock=None) -> None:
+    """Give each story worker process its own HTTP connection pool and share of CPU threads.
+    
+    media_claims/media_claims_lock are Manager proxies shared by all workers, so concurrent
+    stories never pick the same stock media.
+    """
+    global _HTTP_SESSION, _CPU_THREADS, _MEDIA_CLAIMS, _MEDIA_CLAIMS_LOCK
+    setup_logging()
+    _HTTP_SESSION = create_http_session()
+    _CPU_THREADS = max(1, (os.cpu_count() or 4) // worker_count)
+    if media_claims is not None:
+        _MEDIA_CLAIMS, _MEDIA_CLAIMS_LOCK = media_claims, media_claims_lock
+
+
+def create_story_thumbnail(video_index: int, story: ArticleCandidate, title: str, config: Config) -> Optional[Path]:
+    """Create the YouTube thumbnail for a story, or return None if that fails.
+    
+    Safe to run on a worker thread: load_font and the Coiny path lookup are
+    lru_cached (thread-safe) and the image work is local to this call.
+    """
     try:
-        commit_and_push_video(output_path, article.title)
+        # Clean title for filename
+        safe_title = safe_filename_title(story.title, 30)
+        thumbnail_filename = f"thumbnail_{video_index + 1}_{safe_title}.png"
+        thumbnail_path = create_thumbnail(story, title, config.output_dir / thumbnail_filename, config)
+        if thumbnail_path:
+            logging.info("Thumbnail created: %s", thumbnail_path)
+        else:
+            logging.warning("Thumbnail creation failed, continuing without thumbnail")
+        return thumbnail_path
     except Exception as exc:
-        logging.warning("Failed to commit and push video to git: %s", exc)
+        logging.warning("Failed to create thumbnail: %s", exc)
+        return None
+
+
+def prepare_story_video(video_index: int, story: ArticleCandidate, total: int, config: Config) -> Tuple[Path, Dict, Optional[Path]]:
+    """Script, render and thumbnail one story (runs in a worker process).
     
-    return output_path
+    Returns:
+        (video_path, metadata, thumbnail_path or None)
+    """
+    logging.info("=" * 60)
+    logging.info("Processing video %d/%d: %s", video_index + 1, total, story.title[:60])
+    logging.info("=" * 60)
+    
+    script = generate_script(story, config)
+    metadata = generate_metadata(story, script)
+    
+    # The thumbnail only needs the title, so draw it on a thread while the video renders
+    with ThreadPoolExecutor(max_workers=1) as thumbnail_executor:
+        thumbnail_future = None
+        if config.upload_to_youtube:
+            thumbnail_future = thumbnail_executor.submit(create_story_thumbnail, video_index, story, metadata["title"], config)
+        
+        video_path = assemble_video(story, script, config, video_index)
+
+        logging.info("Video generation completed successfully")
+        logging.info("Video path: %s", video_path)
+        logging.info("Metadata: %s", metadata)
+        
+        thumbnail_path = thumbnail_future.result() if thumbnail_future else None
+    
+    return video_path, metadata, thumbnail_path
+
+
+def publish_story_video(video_index: int, story: ArticleCandidate, total: int, config: Config,
+                        video_path: Path, metadata: Dict, thumbnail_path: Optional[Path]) -> None:
+    """Upload a rendered story video and mark the story as covered."""
+    # Upload to both platforms concurrently; they are independent network-bound calls
+    async def _skipped():
+        return None
+    
+    async def _upload_all():
+        if config.upload_to_youtube:
+            logging.info("Attempting to upload to YouTube...")
+        else:
+            logging.info("YouTube upload disabled in config")
+        if config.upload_to_tiktok:
+            logging.info("Attempting to upload to TikTok...")
+        else:
+            logging.info("TikTok upload disabled in config")
+        return await asyncio.gather(
+            asyncio.to_thread(
+                upload_to_youtube,
+                video_path,
+                metadata["title"],
+                metadata["description"],
+                metadata["tags"],
+                config,
+                thumbnail_path,
+            ) if config.upload_to_youtube else _skipped(),
+            asyncio.to_thread(
+                upload_to_tiktok,
+                video_path,
+                metadata["title"],
+                config,
+            ) if config.upload_to_tiktok else _skipped(),
+            return_exceptions=True,
+        )
+    
+    youtube_video_id, tiktok_video_id = asyncio.run(_upload_all())
+    
+    if isinstance(youtube_video_id, Exception):
+        logging.error("YouTube upload error: %s", youtube_video_id, exc_info=youtube_video_id)
+        logging.warning("Continuing with pipeline despite YouTube upload failure")
+        youtube_video_id = None
+    elif config.upload_to_youtube:
+        if youtube_video_id:
+            logging.info("YouTube upload successful: https://www.youtube.com/watch?v=%s", youtube_video_id)
+        else:
+            logging.warning("YouTube upload failed, but continuing with pipeline")
+    
+    if isinstance(tiktok_video_id, Exception):
+        logging.error("TikTok upload error: %s", tiktok_video_id, exc_info=tiktok_video_id)
+        logging.warning("Continuing with pipeline despite TikTok upload failure")
+        tiktok_video_id = None
+    elif config.upload_to_tiktok:
+        if tiktok_video_id:
+            logging.info("TikTok upload successful: %s", tiktok_video_id)
+        else:
+            logging.warning("TikTok upload failed, but continuing with pipeline")
+    
+    # Log success for this video
+    logging.info("Video %d/%d completed:", video_index + 1, total)
+    logging.info("  File: %s", video_path)
+    if youtube_video_id:
+        logging.info("  YouTube: https://www.youtube.com/watch?v=%s", youtube_video_id)
+    if tiktok_video_id:
+        logging.info("  TikTok: %s", tiktok_video_id)
+    
+    # Mark story as covered (only if video was successfully created); the write happens
+    # on the persistence thread, which main() drains before exiting
+    _PERSIST_EXECUTOR.submit(save_covered_story, story, config, youtube_video_id, tiktok_video_id)
 
 
 def main() -> None:
@@ -5178,106 +6341,47 @@ def main() -> None:
     
     logging.info("Selected %d story/stories for video generation", len(stories))
     
-    # Process each story
+    # Process stories concurrently: each worker process scripts, renders and thumbnails one
+    # story while uploads and bookkeeping for finished videos happen here in the parent
     successful_videos = 0
     failed_videos = 0
-    
-    for video_index, story in enumerate(stories):
-        logging.info("=" * 60)
-        logging.info("Processing video %d/%d: %s", video_index + 1, len(stories), story.title[:60])
-        logging.info("=" * 60)
-        
-        try:
-            script = generate_script(story, config)
-            metadata = generate_metadata(story, script)
-            video_path = assemble_video(story, script, config, video_index)
-
-            logging.info("Video generation completed successfully")
-            logging.info("Video path: %s", video_path)
-            logging.info("Metadata: %s", metadata)
-            
-            # Create thumbnail
-            thumbnail_path = None
-            if config.upload_to_youtube:
-                try:
-                    # Clean title for filename (move regex outside f-string to avoid backslash issue)
-                    safe_title = re.sub(r'[^\w\s-]', '', story.title)[:30].strip().replace(' ', '_')
-                    thumbnail_filename = f"thumbnail_{video_index + 1}_{safe_title}.png"
-                    thumbnail_path = config.output_dir / thumbnail_filename
-                    thumbnail_path = create_thumbnail(story, metadata["title"], thumbnail_path, config)
-                    if thumbnail_path:
-                        logging.info("Thumbnail created: %s", thumbnail_path)
-                    else:
-                        logging.warning("Thumbnail creation failed, continuing without thumbnail")
-                except Exception as exc:
-                    logging.warning("Failed to create thumbnail: %s", exc)
-            
-            # Upload to platforms
-            youtube_video_id = None
-            tiktok_video_id = None
-            
-            # Upload to YouTube
-            if config.upload_to_youtube:
-                logging.info("Attempting to upload to YouTube...")
-                try:
-                    youtube_video_id = upload_to_youtube(
-                        video_path,
-                        metadata["title"],
-                        metadata["description"],
-                        metadata["tags"],
-                        config,
-                        thumbnail_path,
-                    )
-                    if youtube_video_id:
-                        logging.info("YouTube upload successful: https://www.youtube.com/watch?v=%s", youtube_video_id)
-                    else:
-                        logging.warning("YouTube upload failed, but continuing with pipeline")
-                except Exception as exc:
-                    logging.error("YouTube upload error: %s", exc, exc_info=True)
-                    logging.warning("Continuing with pipeline despite YouTube upload failure")
-            else:
-                logging.info("YouTube upload disabled in config")
-            
-            # Upload to TikTok
-            if config.upload_to_tiktok:
-                logging.info("Attempting to upload to TikTok...")
-                try:
-                    tiktok_video_id = upload_to_tiktok(
-                        video_path,
-                        metadata["title"],
-                        config,
-                    )
-                    if tiktok_video_id:
-                        logging.info("TikTok upload successful: %s", tiktok_video_id)
-                    else:
-                        logging.warning("TikTok upload failed, but continuing with pipeline")
-                except Exception as exc:
-                    logging.error("TikTok upload error: %s", exc, exc_info=True)
-                    logging.warning("Continuing with pipeline despite TikTok upload failure")
-            else:
-                logging.info("TikTok upload disabled in config")
-            
-            # Log success for this video
-            logging.info("Video %d/%d completed:", video_index + 1, len(stories))
-            logging.info("  File: %s", video_path)
-            if youtube_video_id:
-                logging.info("  YouTube: https://www.youtube.com/watch?v=%s", youtube_video_id)
-            if tiktok_video_id:
-                logging.info("  TikTok: %s", tiktok_video_id)
-            
-            # Mark story as covered (only if video was successfully created)
+    staged_videos: Dict[Path, List[Tuple[Path, str]]] = {}  # repo root -> [(video path, title)]
+    
+    # Resolve (and if needed download) the Coiny font once here, so story workers only
+    # find it on disk instead of racing to download it for their captions and thumbnails
+    get_coiny_font_path(config)
+    trim_media_cache(config)
+    
+    worker_count = story_worker_count(len(stories))
+    with multiprocessing.Manager() as manager, ProcessPoolExecutor(
+        max_workers=worker_count, initializer=_init_story_worker,
+        initargs=(worker_count, manager.dict(), manager.Lock()),
+    ) as executor:
+        futures = {
+            executor.submit(prepare_story_video, video_index, story, len(stories), config): (video_index, story)
+            for video_index, story in enumerate(stories)
+        }
+        for future in as_completed(futures):
+            video_index, story = futures[future]
             try:
-                save_covered_story(story, config, youtube_video_id, tiktok_video_id)
+                video_path, metadata, thumbnail_path = future.result()
+                publish_story_video(video_index, story, len(stories), config, video_path, metadata, thumbnail_path)
+                successful_videos += 1
+                staged = stage_video(video_path)
+                if staged:
+                    repo_root, relative_video_path = staged
+                    staged_videos.setdefault(repo_root, []).append((relative_video_path, story.title))
             except Exception as exc:
-                logging.warning("Failed to save covered story: %s", exc)
-            
-            successful_videos += 1
-            
-        except Exception as exc:
-            logging.error("Failed to process video %d/%d for story '%s': %s", 
-                         video_index + 1, len(stories), story.title[:60], exc, exc_info=True)
-            failed_videos += 1
-            continue
+                logging.error("Failed to process video %d/%d for story '%s': %s", 
+                             video_index + 1, len(stories), story.title[:60], exc, exc_info=True)
+                failed_videos += 1
+    
+    # Wait for covered stories to be written before the run ends
+    _PERSIST_EXECUTOR.shutdown(wait=True)
+    
+    # Commit and push all videos to the git repository at once
+    for repo_root, videos in staged_videos.items():
+        commit_and_push_videos(repo_root, videos)
     
     # Final summary
     logging.info("=" * 60)